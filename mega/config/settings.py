@@ -12,19 +12,34 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 
-import boto3
 import os 
 
+from config.parameters import ParameterStore
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
-# AWS SSM 클라이언트 생성
-ssm = boto3.client('ssm', region_name='ap-northeast-2')
+# AWS Parameter Store 값은 GetParameters 로 묶어서 한 번에 가져온다 (config/parameters.py)
+parameters = ParameterStore.from_env([
+    '/mega/SECRET_KEY',
+    '/mega/slack/SLACK_APP_TOKEN',
+    '/mega/slack/SLACK_BOT_TOKEN',
+    '/mega/OPENAI_API_KEY',
+    '/mega/calendar/googleCalendarApiKey',
+    '/mega/calendar/googleCalendarId',
+    '/mega/auth/google/CLIENT_ID',
+    '/mega/auth/google/CLIENT_SECRET',
+    '/mega/oh-db-info/DB_NAME',
+    '/mega/oh-db-info/DB_USER',
+    '/mega/oh-db-info/DB_PASSWORD',
+    '/mega/oh-db-info/DB_HOST',
+    '/mega/oh-db-info/DB_PORT',
+], BASE_DIR)
 
 def get_parameter(name, with_decryption=True):
-    """AWS Parameter Store에서 값을 가져오는 함수"""
-    return ssm.get_parameter(Name=name, WithDecryption=with_decryption)['Parameter']['Value']
+    """AWS Parameter Store에서 값을 가져오는 함수 (프로세스 내 캐시 사용)"""
+    return parameters.get(name, with_decryption=with_decryption)
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = get_parameter('/mega/SECRET_KEY')
@@ -105,7 +120,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'allauth.account.middleware.AccountMiddleware' # 로그인 기능
+    'allauth.account.middleware.AccountMiddleware', # 로그인 기능
+    'dashboard.middleware.DBConnectionMetricsMiddleware', # 요청당 DB 연결 생성 수 기록
 ]
 
 
@@ -179,9 +195,33 @@ DATABASES = {
         'PASSWORD': get_parameter('/mega/oh-db-info/DB_PASSWORD'),#, with_decryption=True),
         'HOST': get_parameter('/mega/oh-db-info/DB_HOST'),
         'PORT': get_parameter('/mega/oh-db-info/DB_PORT'),
+        # 요청마다 RDS 에 새로 접속(TLS + 인증)하지 않도록 연결을 재사용한다.
+        # MySQL wait_timeout 보다 짧게 두고, 재사용 전 상태 확인으로 끊긴 연결을 걸러낸다.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
     }
 }
 
+# Cache
+# 기본은 프로세스 로컬 메모리 캐시. 여러 gunicorn 워커/관리 명령 간 무효화를 공유하려면
+# DJANGO_CACHE_BACKEND/DJANGO_CACHE_LOCATION 으로 Redis·Memcached 등 공유 백엔드를 지정한다.
+# Slack 에이전트와 같은 백엔드를 쓰면 HR 데이터 재적재(import_csv_data) 시 로그인 사용자 정보 캐시도 무효화된다.
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', 'mega-dashboard'),
+    }
+}
+
+# 대시보드 섹션 캐시 TTL (초). 지난 기간 섹션은 공유 백엔드에서는 만료 없이 캐시되고,
+# LocMem 처럼 프로세스 로컬 백엔드에서는 관리 명령의 무효화가 워커에 닿지 않으므로
+# DASHBOARD_CACHE_LOCAL_PAST_TTL 이 지나면 만료된다.
+DASHBOARD_CACHE_CURRENT_TTL = int(os.getenv('DASHBOARD_CACHE_CURRENT_TTL', '60'))
+DASHBOARD_CACHE_ROSTER_TTL = int(os.getenv('DASHBOARD_CACHE_ROSTER_TTL', '300'))
+DASHBOARD_CACHE_LOCAL_PAST_TTL = int(os.getenv('DASHBOARD_CACHE_LOCAL_PAST_TTL', '900'))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,56 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from dashboard.models import hrdatabase_chatbotconversations
+from dashboard.services.index_service import (
+    covering_index,
+    dashboard_index_plan,
+    existing_columns,
+    index_columns,
+    rejected_flag_field,
+)
+
+
+class Command(BaseCommand):
+    help = "Create the dashboard filter indexes (and rejected flag column) on the unmanaged HR tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="실행하지 않고 적용할 SQL만 출력",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        column_added = False
+
+        with connection.schema_editor(collect_sql=dry_run, atomic=False) as editor:
+            conversation_table = hrdatabase_chatbotconversations._meta.db_table
+            flag_field = rejected_flag_field()
+            if flag_field.column in existing_columns(conversation_table):
+                self.stdout.write(f"skip column {conversation_table}.{flag_field.column} (exists)")
+            else:
+                editor.add_field(hrdatabase_chatbotconversations, flag_field)
+                column_added = True
+                self.stdout.write(f"add column {conversation_table}.{flag_field.column}")
+
+            for model, index in dashboard_index_plan():
+                table = model._meta.db_table
+                columns = index_columns(model, index)
+                covered_by = covering_index(table, columns)
+                if covered_by:
+                    self.stdout.write(f"skip {index.name} on {table}{tuple(columns)} (covered by {covered_by})")
+                    continue
+                editor.add_index(model, index)
+                self.stdout.write(f"add index {index.name} on {table}{tuple(columns)}")
+
+        if dry_run:
+            for statement in editor.collected_sql:
+                self.stdout.write(statement)
+            return
+        if column_added:
+            # 새로 추가된 컬럼은 모두 False 이므로 기존 반려 응답을 한 번 채움
+            call_command("backfill_rejected_flag")
+        self.stdout.write(self.style.SUCCESS("Dashboard indexes are in place."))
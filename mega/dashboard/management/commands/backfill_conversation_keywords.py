@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.models import hrdatabase_chatbotconversations
+from dashboard.services.keyword_service import sync_keywords_in_batches
+
+
+class Command(BaseCommand):
+    help = "Backfill hrdatabase_conversationkeyword from hrdatabase_chatbotconversations.keyword"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--since",
+            help="YYYY-MM-DD 이후 질문만 다시 채운다 (기본: 전체)",
+        )
+
+    def handle(self, *args, **options):
+        conversations = hrdatabase_chatbotconversations.objects.all()
+        if options["since"]:
+            conversations = conversations.filter(question_date__gte=options["since"])
+
+        processed = 0
+        created = 0
+        for batch_conversations, batch_rows in sync_keywords_in_batches(
+            conversations, options["batch_size"]
+        ):
+            processed += batch_conversations
+            created += batch_rows
+            self.stdout.write(f"... {processed} conversations, {created} keywords")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled {created} keywords from {processed} conversations."
+            )
+        )
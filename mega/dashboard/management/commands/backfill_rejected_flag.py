@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.models import hrdatabase_chatbotconversations
+from dashboard.services.cache_service import invalidate_conversation_sections
+from dashboard.services.rollup_service import mark_rejected
+
+
+class Command(BaseCommand):
+    help = "Backfill hrdatabase_chatbotconversations.is_rejected from the answer column"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        conversations = hrdatabase_chatbotconversations.objects
+
+        updated = mark_rejected(conversations.all(), batch_size=batch_size)
+
+        # 반려 질문 패널 캐시(지난 달은 만료 없음)를 모두 무효화
+        invalidate_conversation_sections(
+            conversations.filter(is_rejected=True)
+            .values_list("question_date", flat=True)
+            .distinct()
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled is_rejected for {updated} conversations.")
+        )
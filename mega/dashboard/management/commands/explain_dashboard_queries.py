@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from config.settings import MOCK_TODAY
+from dashboard.models import hrdatabase_chatbotconversations
+from dashboard.services.index_service import dashboard_index_plan, explain
+from dashboard.services.roster_service import get_employee_roster
+from dashboard.services.stats_service import rejected_questions_queryset
+from dashboard.views import TEAM_ID_MAP
+
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN on the hot dashboard queries and report whether they use the dashboard indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dept", default="dev", choices=sorted(TEAM_ID_MAP))
+
+    def handle(self, *args, **options):
+        team_ids = TEAM_ID_MAP[options["dept"]]
+        end = MOCK_TODAY
+        start = end - timedelta(days=30)
+
+        queries = {
+            "rejected questions": rejected_questions_queryset(team_ids, start, end),
+            "employee roster": get_employee_roster(team_ids)[:10],
+            "conversations by date (rollup)": (
+                hrdatabase_chatbotconversations.objects
+                .filter(question_date__range=(start, end))
+                .values("question_date", "team_id")
+            ),
+        }
+        planned = {index.name for _, index in dashboard_index_plan()}
+
+        problems = 0
+        for label, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"[{label}]"))
+            for row in explain(queryset):
+                if "plan" in row:
+                    # MySQL 이 아닌 경우 실행 계획 원문만 출력
+                    self.stdout.write(row["plan"])
+                    continue
+
+                key = row.get("key")
+                access = row.get("type")
+                line = (
+                    f"  table={row.get('table')} type={access} key={key} "
+                    f"rows={row.get('rows')} extra={row.get('Extra')}"
+                )
+                if access == "ALL":
+                    problems += 1
+                    self.stdout.write(self.style.WARNING(line + "  <- full table scan"))
+                elif key in planned or key == "PRIMARY":
+                    self.stdout.write(self.style.SUCCESS(line))
+                else:
+                    self.stdout.write(line)
+
+        if connection.vendor != "mysql":
+            return
+        if problems:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{problems} full table scan(s). Run `manage.py apply_dashboard_indexes` first?"
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("All dashboard queries use an index."))
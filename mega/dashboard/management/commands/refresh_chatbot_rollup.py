@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.services.rollup_service import refresh_daily_rollup
+
+
+class Command(BaseCommand):
+    help = "Incrementally refresh the daily chatbot rollup tables used by the dashboard"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="워터마크와 무관하게 전체 날짜를 다시 집계",
+        )
+        parser.add_argument(
+            "--since",
+            help="YYYY-MM-DD 이후 날짜를 함께 다시 집계 (수정/삭제된 과거 대화 반영용)",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            try:
+                since = datetime.strptime(options["since"], "%Y-%m-%d").date()
+            except ValueError:
+                raise CommandError("--since 는 YYYY-MM-DD 형식이어야 합니다.")
+
+        refreshed = refresh_daily_rollup(full=options["full"], since=since)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed rollup for {refreshed} day(s)."))
@@ -0,0 +1,55 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# 이 간격(요청 수)마다 누적 연결 재사용 통계를 INFO 로 남긴다
+REPORT_EVERY = getattr(settings, 'DB_CONNECTION_METRICS_REPORT_EVERY', 500)
+
+_local = threading.local()
+_lock = threading.Lock()
+_totals = {'requests': 0, 'connections_opened': 0}
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _local.opened = getattr(_local, 'opened', 0) + 1
+
+
+connection_created.connect(_on_connection_created, dispatch_uid='dashboard_connection_metrics')
+
+
+def get_connection_metrics():
+    """프로세스 누적 {'requests', 'connections_opened'}"""
+    with _lock:
+        return dict(_totals)
+
+
+class DBConnectionMetricsMiddleware:
+    """
+    요청마다 새로 연 DB 연결 수를 센다. CONN_MAX_AGE 로 연결이 재사용되면
+    대부분의 요청에서 0 이 되어야 한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _local.opened = 0
+        response = self.get_response(request)
+        opened = _local.opened
+
+        with _lock:
+            _totals['requests'] += 1
+            _totals['connections_opened'] += opened
+            totals = dict(_totals)
+
+        logger.debug(f"[db] {request.path} opened {opened} connection(s)")
+        if totals['requests'] % REPORT_EVERY == 0:
+            logger.info(
+                f"[db] {totals['connections_opened']} connection(s) opened "
+                f"for {totals['requests']} request(s) in this worker"
+            )
+        return response
@@ -1,5 +1,8 @@
 from django.db import models
 
+# 챗봇이 답변을 거절(반려)할 때 저장하는 고정 응답
+REJECTED_ANSWER = "해당 질문은 대답할 수 없습니다."
+
 # 공통 코드
 class hrdatabase_hrmastercode(models.Model):
     code = models.CharField(max_length=10, primary_key=True)
@@ -146,11 +149,81 @@ class hrdatabase_chatbotconversations(models.Model):
     question_date = models.DateField(null=True, blank=True)
     team_id = models.ForeignKey('hrdatabase_teammanagement', on_delete=models.CASCADE, db_column='team_id', to_field='team_id', null=True, blank=True)
     keyword = models.TextField(null=True, blank=True)
+    is_rejected = models.BooleanField(default=False, db_default=False)  # 반려 응답 여부 (apply_dashboard_indexes 로 컬럼 추가)
     
     class Meta:
         db_table = 'hrdatabase_chatbotconversations'
         managed = False 
 
+    def save(self, *args, **kwargs):
+        # TEXT answer 비교 없이 인덱스로 반려 질문을 찾도록 저장 시점에 플래그 기록
+        # (챗봇은 ORM 을 거치지 않고 기록하므로 그 행들은 refresh_chatbot_rollup 이 채움)
+        self.is_rejected = self.answer == REJECTED_ANSWER
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Conversation {self.conversation_id} - {self.team_id}"
 
+
+
+# 대화 키워드 (keyword 컬럼의 리스트 문자열을 한 행에 한 키워드로 정규화)
+class hrdatabase_conversationkeyword(models.Model):
+    conversation_id = models.ForeignKey(hrdatabase_chatbotconversations, on_delete=models.CASCADE, db_column='conversation_id')
+    keyword = models.CharField(max_length=100)
+    team_id = models.CharField(max_length=50, null=True, blank=True)  # 대화 당시 팀 코드 (조회용 비정규화)
+    question_date = models.DateField(null=True, blank=True)  # 질문 일자 (조회용 비정규화)
+
+    class Meta:
+        db_table = 'hrdatabase_conversationkeyword'
+        indexes = [
+            models.Index(fields=['team_id', 'question_date', 'keyword'], name='convkw_team_date_kw_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.keyword} (conversation {self.conversation_id_id})"
+
+
+# 챗봇 일별 집계 (날짜 × 팀)
+class hrdatabase_chatbotdailyrollup(models.Model):
+    rollup_date = models.DateField()
+    team_id = models.CharField(max_length=50, null=True, blank=True)
+    total_questions = models.IntegerField(default=0)  # 전체 질문 수
+
+    class Meta:
+        db_table = 'hrdatabase_chatbotdailyrollup'
+        constraints = [
+            models.UniqueConstraint(fields=["rollup_date", "team_id"], name="unique_rollup_date_team")
+        ]
+
+    def __str__(self):
+        return f"{self.rollup_date} - {self.team_id}: {self.total_questions}"
+
+
+# 챗봇 일별 키워드 집계 (날짜 × 팀 × 키워드)
+class hrdatabase_chatbotkeywordrollup(models.Model):
+    rollup_date = models.DateField()
+    team_id = models.CharField(max_length=50, null=True, blank=True)
+    keyword = models.CharField(max_length=100)
+    keyword_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'hrdatabase_chatbotkeywordrollup'
+        indexes = [
+            models.Index(fields=['team_id', 'rollup_date'], name='kwrollup_team_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.rollup_date} - {self.team_id}: {self.keyword}({self.keyword_count})"
+
+
+# 집계 워터마크 (마지막으로 반영한 conversation_id)
+class hrdatabase_rollupwatermark(models.Model):
+    name = models.CharField(max_length=50, primary_key=True)
+    last_conversation_id = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'hrdatabase_rollupwatermark'
+
+    def __str__(self):
+        return f"{self.name}: {self.last_conversation_id}"
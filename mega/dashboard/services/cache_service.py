@@ -0,0 +1,115 @@
+import hashlib
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import caches
+
+# 섹션 데이터의 원천 (무효화 단위)
+CONVERSATIONS = 'conversations'  # 챗봇 대화 / 일별 집계 기반 섹션
+ATTENDANCE = 'attendance'        # 직원·팀·근태 기반 섹션
+EMPLOYEES = 'employees'          # 로그인 사용자 정보(직원·팀)
+
+ALL_MONTHS = 'all'
+
+DASHBOARD_CACHE_ALIAS = getattr(settings, 'DASHBOARD_CACHE_ALIAS', 'default')
+# 진행 중인 기간(이번 주/이번 달) 섹션의 TTL (초)
+CURRENT_PERIOD_TTL = getattr(settings, 'DASHBOARD_CACHE_CURRENT_TTL', 60)
+# 직원 목록 섹션의 TTL (초)
+ROSTER_TTL = getattr(settings, 'DASHBOARD_CACHE_ROSTER_TTL', 300)
+# 프로세스 로컬 백엔드에서 지난 기간 섹션의 TTL (초)
+LOCAL_PAST_PERIOD_TTL = getattr(settings, 'DASHBOARD_CACHE_LOCAL_PAST_TTL', 900)
+
+# 프로세스마다 따로 저장되어 관리 명령의 세대 번호 증가가 gunicorn 워커에 전달되지 않는 백엔드
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def _cache():
+    return caches[DASHBOARD_CACHE_ALIAS]
+
+
+def _generation_key(source, month):
+    # EMPLOYEES 키는 Slack 에이전트의 import_csv_data 도 같은 캐시 백엔드에서 올린다
+    # (tests/myproject/agent/services/user_context_service.py)
+    return f"dashboard:gen:{source}:{month}"
+
+
+def months_between(start, end):
+    """start~end 기간이 걸치는 'YYYY-MM' 목록"""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def is_shared_cache():
+    """대시보드 캐시 백엔드를 여러 프로세스가 공유하는지 (Redis·Memcached·DB 등)"""
+    backend = settings.CACHES[DASHBOARD_CACHE_ALIAS]['BACKEND']
+    return backend not in PROCESS_LOCAL_BACKENDS
+
+
+def period_timeout(period_end, today):
+    """
+    진행 중인 기간은 짧은 TTL로 캐시한다. 이미 끝난 기간은 세대 번호로만 무효화되므로
+    공유 백엔드에서는 만료 없이, 프로세스 로컬 백엔드에서는 LOCAL_PAST_PERIOD_TTL 로 캐시한다.
+    """
+    if period_end >= today:
+        return CURRENT_PERIOD_TTL
+    return None if is_shared_cache() else LOCAL_PAST_PERIOD_TTL
+
+
+def cached_section(section, key_parts, compute, source, months=(ALL_MONTHS,), timeout=CURRENT_PERIOD_TTL):
+    """
+    대시보드 섹션 하나의 계산 결과를 캐시한다.
+
+    키에는 섹션 이름, 부서/기간 등 key_parts, 그리고 (source, 월)별 세대 번호가 들어간다.
+    invalidate_* 함수가 세대 번호를 올리면 해당 월을 포함하는 키만 자연히 무효화된다.
+    """
+    cache = _cache()
+    generation_keys = [_generation_key(source, month) for month in months]
+    generations = cache.get_many(generation_keys)
+    versions = '.'.join(str(generations.get(key, 0)) for key in generation_keys)
+
+    # key_parts에는 요청 파라미터가 그대로 들어오므로 백엔드 키 제약에 맞게 해시
+    digest = hashlib.md5(repr(tuple(key_parts)).encode('utf-8')).hexdigest()
+    key = f"dashboard:{section}:{versions}:{digest}"
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
+
+
+def _bump(source, month):
+    cache = _cache()
+    key = _generation_key(source, month)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # add 와 incr 사이에 키가 축출된 경우
+        cache.set(key, 1, None)
+
+
+def invalidate_conversation_sections(dates):
+    """주어진 날짜들이 속한 월의 대화 기반 섹션 캐시를 무효화한다."""
+    months = set()
+    for d in dates:
+        if isinstance(d, date):
+            months.add(f"{d.year:04d}-{d.month:02d}")
+    for month in months:
+        _bump(CONVERSATIONS, month)
+
+
+def invalidate_attendance_sections():
+    """직원 목록(근태) 섹션 캐시를 무효화한다."""
+    _bump(ATTENDANCE, ALL_MONTHS)
+
+
+def invalidate_user_contexts():
+    """로그인 사용자 정보(UserContext) 캐시를 무효화한다."""
+    _bump(EMPLOYEES, ALL_MONTHS)
@@ -0,0 +1,70 @@
+from django.db import connection, models
+
+from dashboard.models import (
+    hrdatabase_attendancemanagement,
+    hrdatabase_attendancerecord,
+    hrdatabase_chatbotconversations,
+    hrdatabase_teammanagement,
+)
+
+
+def rejected_flag_field():
+    """hrdatabase_chatbotconversations 의 반려 플래그 필드 (TEXT answer 전체 비교 대신 사용)"""
+    return hrdatabase_chatbotconversations._meta.get_field('is_rejected')
+
+
+def dashboard_index_plan():
+    """
+    managed = False 테이블이라 Django 마이그레이션이 만들지 않는 대시보드용 인덱스 목록.
+    [(model, models.Index), ...]
+    """
+    return [
+        (hrdatabase_chatbotconversations, models.Index(
+            fields=['team_id', 'question_date'], name='chatconv_team_date_idx')),
+        (hrdatabase_chatbotconversations, models.Index(
+            fields=['question_date'], name='chatconv_date_idx')),
+        (hrdatabase_chatbotconversations, models.Index(
+            fields=['is_rejected', 'team_id', 'question_date'], name='chatconv_rejected_idx')),
+        (hrdatabase_teammanagement, models.Index(
+            fields=['team_id', 'employee_id'], name='teammgmt_team_emp_idx')),
+        (hrdatabase_attendancemanagement, models.Index(
+            fields=['employee_id'], name='attmgmt_employee_idx')),
+        (hrdatabase_attendancerecord, models.Index(
+            fields=['employee_id'], name='attrecord_employee_idx')),
+    ]
+
+
+def index_columns(model, index):
+    """Index.fields(필드 이름)를 실제 컬럼 이름 목록으로 변환"""
+    return [model._meta.get_field(name).column for name in index.fields]
+
+
+def existing_columns(table):
+    with connection.cursor() as cursor:
+        return {col.name for col in connection.introspection.get_table_description(cursor, table)}
+
+
+def covering_index(table, columns):
+    """columns 를 앞부분(prefix)으로 갖는 기존 인덱스/PK 이름, 없으면 None"""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    for name, info in constraints.items():
+        if not (info.get('index') or info.get('primary_key') or info.get('unique')):
+            continue
+        if list(info['columns'][:len(columns)]) == list(columns):
+            return name
+    return None
+
+
+def explain(queryset):
+    """
+    queryset 에 대해 EXPLAIN 을 실행하고 행 목록(dict)을 반환한다.
+    MySQL 이외의 백엔드에서는 QuerySet.explain() 원문을 {'plan': ...} 하나로 반환한다.
+    """
+    if connection.vendor != 'mysql':
+        return [{'plan': queryset.explain()}]
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN {sql}", params)
+        names = [col[0] for col in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
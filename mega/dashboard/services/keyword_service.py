@@ -0,0 +1,87 @@
+import ast
+
+from django.db import transaction
+from django.db.models import Sum
+
+from dashboard.models import hrdatabase_chatbotkeywordrollup, hrdatabase_conversationkeyword
+
+KEYWORD_MAX_LENGTH = hrdatabase_conversationkeyword._meta.get_field('keyword').max_length
+
+
+def parse_keywords(raw):
+    """
+    chatbotconversations.keyword 에 저장된 파이썬 리스트 문자열을 키워드 리스트로 변환한다.
+    파싱할 수 없거나 리스트가 아니면 빈 리스트를 반환한다.
+    """
+    if not raw:
+        return []
+    try:
+        parsed = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return []
+    if not isinstance(parsed, list):
+        return []
+    keywords = []
+    for item in parsed:
+        keyword = str(item).strip()
+        if keyword:
+            keywords.append(keyword[:KEYWORD_MAX_LENGTH])
+    return keywords
+
+
+def build_keyword_rows(conversation):
+    """대화 한 건에 대한 hrdatabase_conversationkeyword 인스턴스 목록 (저장 전)"""
+    return [
+        hrdatabase_conversationkeyword(
+            conversation_id_id=conversation.conversation_id,
+            keyword=keyword,
+            team_id=conversation.team_id_id,
+            question_date=conversation.question_date,
+        )
+        for keyword in parse_keywords(conversation.keyword)
+    ]
+
+
+def sync_keywords_in_batches(conversations, batch_size=1000):
+    """
+    conversations(QuerySet)의 키워드 행을 keyword 컬럼 값으로 다시 맞춘다.
+    대화는 agent/외부에서 저장되므로 저장 시점 훅 대신 이 함수로 동기화한다.
+    conversation_id 순서로 batch_size 건씩 처리하며, 배치마다 (대화 수, 키워드 행 수) 를 반환하는 generator.
+    """
+    conversations = conversations.only(
+        'conversation_id', 'keyword', 'team_id', 'question_date'
+    ).order_by('conversation_id')
+
+    last_id = 0
+    while True:
+        batch = list(conversations.filter(conversation_id__gt=last_id)[:batch_size])
+        if not batch:
+            break
+        last_id = batch[-1].conversation_id
+
+        rows = []
+        for conversation in batch:
+            rows.extend(build_keyword_rows(conversation))
+
+        with transaction.atomic():
+            hrdatabase_conversationkeyword.objects.filter(
+                conversation_id__in=[c.conversation_id for c in batch]
+            ).delete()
+            hrdatabase_conversationkeyword.objects.bulk_create(rows, batch_size=batch_size)
+
+        yield len(batch), len(rows)
+
+
+def get_top_keywords(team_ids, start_date, end_date, limit=10):
+    """
+    기간 내 부서 팀들의 키워드 빈도 상위 limit 개를 [(keyword, count), ...] 로 반환한다.
+    일별 키워드 집계 테이블에서 GROUP BY keyword 한 번으로 처리한다.
+    """
+    rows = (
+        hrdatabase_chatbotkeywordrollup.objects
+        .filter(team_id__in=team_ids, rollup_date__range=(start_date, end_date))
+        .values('keyword')
+        .annotate(count=Sum('keyword_count'))
+        .order_by('-count', 'keyword')[:limit]
+    )
+    return [(row['keyword'], row['count']) for row in rows]
@@ -0,0 +1,127 @@
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, Max, Min, Q, Value, When
+
+from dashboard.models import (
+    REJECTED_ANSWER,
+    hrdatabase_chatbotconversations,
+    hrdatabase_chatbotdailyrollup,
+    hrdatabase_chatbotkeywordrollup,
+    hrdatabase_conversationkeyword,
+    hrdatabase_rollupwatermark,
+)
+from dashboard.services.cache_service import invalidate_conversation_sections
+from dashboard.services.keyword_service import sync_keywords_in_batches
+
+WATERMARK_NAME = 'chatbot_daily'
+
+# 한 트랜잭션에서 다시 집계할 최대 일수
+DAYS_PER_CHUNK = 31
+
+# 워터마크보다 작은 id 로 늦게 커밋된 대화를 놓치지 않도록 매번 다시 훑는 id 범위
+WATERMARK_OVERLAP_IDS = 1000
+
+
+def refresh_daily_rollup(full=False, since=None):
+    """
+    워터마크(마지막으로 반영한 conversation_id) 이후 새로 들어온 대화가 있는 날짜만
+    다시 집계한다. 늦게 커밋된 대화를 위해 워터마크 앞 WATERMARK_OVERLAP_IDS 개도 다시 본다.
+    full=True면 전체 날짜를, since(date)가 주어지면 그 날짜 이후를 함께 다시 집계한다. 집계 전에 대상 대화들의 키워드 행을 keyword 컬럼에서 다시 만든다.
+    반환값: 다시 집계한 날짜 수
+    """
+    watermark, _ = hrdatabase_rollupwatermark.objects.get_or_create(name=WATERMARK_NAME)
+
+    # 집계 도중 들어오는 대화는 다음 실행에서 반영되도록 상한을 먼저 고정
+    upper_id = (
+        hrdatabase_chatbotconversations.objects
+        .aggregate(max_id=Max('conversation_id'))['max_id']
+    ) or 0
+
+    conversations = hrdatabase_chatbotconversations.objects.exclude(question_date__isnull=True)
+    if full:
+        dirty = conversations.filter(conversation_id__lte=upper_id)
+    else:
+        lower_id = max(0, watermark.last_conversation_id - WATERMARK_OVERLAP_IDS)
+        condition = Q(conversation_id__gt=lower_id, conversation_id__lte=upper_id)
+        if since:
+            condition |= Q(question_date__gte=since)
+        dirty = conversations.filter(condition)
+    dirty_dates = sorted(dirty.values_list('question_date', flat=True).distinct())
+
+    # 대화는 ORM 밖에서 기록되어 save() 가 플래그를 채우지 않으므로 여기서 반영
+    mark_rejected(dirty)
+
+    # 키워드 집계는 hrdatabase_conversationkeyword 를 읽으므로 먼저 동기화
+    for _ in sync_keywords_in_batches(dirty):
+        pass
+
+    for i in range(0, len(dirty_dates), DAYS_PER_CHUNK):
+        _rebuild_days(dirty_dates[i:i + DAYS_PER_CHUNK])
+    invalidate_conversation_sections(dirty_dates)
+
+    watermark.last_conversation_id = max(upper_id, watermark.last_conversation_id)
+    watermark.save()
+    return len(dirty_dates)
+
+
+def mark_rejected(conversations, batch_size=5000):
+    """
+    answer 가 반려 응답인지로 is_rejected 를 다시 기록한다.
+    PK 범위 단위로 나눠 긴 잠금 없이 갱신하고, 갱신한 행 수를 반환한다.
+    """
+    bounds = conversations.aggregate(lo=Min('conversation_id'), hi=Max('conversation_id'))
+    if bounds['lo'] is None:
+        return 0
+
+    rejected_flag = Case(
+        When(answer=REJECTED_ANSWER, then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField(),
+    )
+    updated = 0
+    for start in range(bounds['lo'] - 1, bounds['hi'], batch_size):
+        with transaction.atomic():
+            updated += conversations.filter(
+                conversation_id__gt=start,
+                conversation_id__lte=start + batch_size,
+            ).update(is_rejected=rejected_flag)
+    return updated
+
+
+def _rebuild_days(days):
+    """주어진 날짜들의 일별/키워드 집계 행을 원본에서 다시 계산해 교체한다."""
+    daily_rows = (
+        hrdatabase_chatbotconversations.objects
+        .filter(question_date__in=days)
+        .values('question_date', 'team_id')
+        .annotate(total=Count('conversation_id'))
+        .order_by()
+    )
+    keyword_rows = (
+        hrdatabase_conversationkeyword.objects
+        .filter(question_date__in=days)
+        .values('question_date', 'team_id', 'keyword')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        hrdatabase_chatbotdailyrollup.objects.filter(rollup_date__in=days).delete()
+        hrdatabase_chatbotkeywordrollup.objects.filter(rollup_date__in=days).delete()
+
+        hrdatabase_chatbotdailyrollup.objects.bulk_create([
+            hrdatabase_chatbotdailyrollup(
+                rollup_date=row['question_date'],
+                team_id=row['team_id'],
+                total_questions=row['total'],
+            )
+            for row in daily_rows
+        ])
+        hrdatabase_chatbotkeywordrollup.objects.bulk_create([
+            hrdatabase_chatbotkeywordrollup(
+                rollup_date=row['question_date'],
+                team_id=row['team_id'],
+                keyword=row['keyword'],
+                keyword_count=row['total'],
+            )
+            for row in keyword_rows
+        ], batch_size=1000)
@@ -0,0 +1,69 @@
+from django.core.paginator import Paginator
+from django.db.models import F, Min
+from django.db.models.functions import Coalesce
+
+from dashboard.models import hrdatabase_employee
+
+# 템플릿 테이블 컬럼 번호 -> 정렬 대상 근태 필드
+ROSTER_SORT_FIELDS = {
+    '7':  'monthly_late_days',
+    '8':  'total_late_days',
+    '9':  'total_absence_days',
+    '10': 'remaining_annual_leave',
+}
+
+ATTENDANCE_FIELDS = (
+    'monthly_late_days',
+    'total_late_days',
+    'total_absence_days',
+    'remaining_annual_leave',
+    'total_annual_leave',
+)
+
+
+def get_employee_roster(team_ids, sort_col=None, sort_dir='none'):
+    """
+    부서(team_ids)에 속한 직원 목록을 근태 정보와 함께 하나의 쿼리셋으로 반환한다.
+
+    팀 소속 + 직원 + 근태를 JOIN/GROUP BY 한 번으로 묶고 정렬도 DB에서 처리하므로,
+    Paginator가 붙이는 LIMIT/OFFSET과 함께 페이지 비용이 부서 인원과 무관하다.
+    근태 정보가 없는 직원은 해당 값이 None이며, 정렬 시에는 0으로 취급한다.
+    """
+    attendance_values = {
+        field: F(f'hrdatabase_attendancemanagement__{field}')
+        for field in ATTENDANCE_FIELDS
+    }
+    roster = (
+        hrdatabase_employee.objects
+        .filter(hrdatabase_teammanagement__team_id__in=team_ids)
+        .values(
+            'employee_id',
+            'employee_name',
+            'employee_level',
+            'phone_number',
+            'email',
+            **attendance_values,
+        )
+        # 여러 팀에 중복 소속된 직원은 한 줄로 합친다
+        .annotate(team_code=Min('hrdatabase_teammanagement__team_id'))
+    )
+
+    if sort_col in ROSTER_SORT_FIELDS and sort_dir in ['asc', 'desc']:
+        sort_key = Coalesce(ROSTER_SORT_FIELDS[sort_col], 0)
+        sort_key = sort_key.desc() if sort_dir == 'desc' else sort_key.asc()
+        return roster.order_by(sort_key, 'employee_id')
+    return roster.order_by('employee_id')
+
+
+def get_roster_page(team_ids, sort_col=None, sort_dir='none', page_number=None, per_page=10):
+    """
+    직원 목록 한 페이지를 캐시 가능한 형태(dict)로 반환한다.
+    {'rows': [...], 'count': 전체 인원, 'number': 실제 페이지 번호}
+    """
+    paginator = Paginator(get_employee_roster(team_ids, sort_col, sort_dir), per_page)
+    page = paginator.get_page(page_number)
+    return {
+        'rows': list(page.object_list),
+        'count': paginator.count,
+        'number': page.number,
+    }
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from django.db.models import BooleanField, Case, Sum, Value, When
+from django.db.models.functions import TruncWeek
+
+from dashboard.models import (
+    hrdatabase_chatbotconversations,
+    hrdatabase_chatbotdailyrollup,
+)
+
+
+def get_weekly_question_stats(team_ids, week_ranges):
+    """
+    주별(월~일) 질문 수를 부서 팀 / 그 외로 나누어 반환한다.
+
+    week_ranges: [(월요일, 일요일), ...] 형태의 연속된 주 목록
+    반환값: [{'label', 'team_count', 'other_count'}, ...] (week_ranges 순서 유지)
+
+    일별 집계 테이블(hrdatabase_chatbotdailyrollup)을 주 버킷(TruncWeek) × 부서 소속
+    여부로 한 번 GROUP BY 하므로, 대화 건수와 무관하게 읽는 행은 (일수 × 팀 수) 이하이고
+    파이썬 쪽 작업량은 주 개수에 비례한다.
+    """
+    if not week_ranges:
+        return []
+
+    range_start = week_ranges[0][0]
+    range_end = week_ranges[-1][1]
+
+    rows = (
+        hrdatabase_chatbotdailyrollup.objects
+        .filter(rollup_date__range=(range_start, range_end))
+        .values(
+            week=TruncWeek('rollup_date'),
+            in_dept=Case(
+                When(team_id__in=team_ids, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        )
+        .annotate(count=Sum('total_questions'))
+        .order_by()
+    )
+
+    counts = {}
+    for row in rows:
+        week = _as_date(row['week'])
+        counts[(week, bool(row['in_dept']))] = row['count']
+
+    stats = []
+    for (w_start, w_end) in week_ranges:
+        label = f"{w_start.strftime('%y/%m/%d')} ~ {w_end.strftime('%y/%m/%d')}"
+        stats.append({
+            'label': label,
+            'team_count': counts.get((w_start, True), 0),
+            'other_count': counts.get((w_start, False), 0),
+        })
+    return stats
+
+
+def _as_date(value):
+    """TruncWeek 결과(백엔드에 따라 date 또는 datetime)를 date로 맞춘다."""
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def rejected_questions_queryset(team_ids, start_date, end_date):
+    """기간 내 부서 팀들의 반려(미응답) 질문 쿼리셋 (최신순)"""
+    # (is_rejected, team_id, question_date) 인덱스 사용, 긴 answer 컬럼은 가져오지 않음
+    return (
+        hrdatabase_chatbotconversations.objects
+        .filter(
+            is_rejected=True,
+            team_id__in=team_ids,
+            question_date__range=(start_date, end_date)
+        )
+        .values('conversation_id', 'question', 'question_date')
+        .order_by('-question_date')
+    )
+
+
+def get_rejected_questions(team_ids, start_date, end_date):
+    """기간 내 부서 팀들의 반려(미응답) 질문 목록 (최신순)"""
+    rejected_qs = rejected_questions_queryset(team_ids, start_date, end_date)
+    cleaned_rejected = []
+    for row in rejected_qs:
+        q_text = row['question'].lstrip() if row['question'] else ""
+        cleaned_rejected.append({
+            'conversation_id': row['conversation_id'],
+            'question': q_text,
+            'question_date': row['question_date'],
+        })
+    return cleaned_rejected
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from dashboard.models import hrdatabase_employee, hrdatabase_teammanagement
+from dashboard.services.cache_service import EMPLOYEES, cached_section
+
+USER_CONTEXT_TTL = getattr(settings, 'DASHBOARD_USER_CONTEXT_TTL', 600)
+
+
+@dataclass(frozen=True)
+class UserContext:
+    email: str
+    employee_id: int
+    employee_name: str
+    team_ids: tuple  # 소속 팀 코드 목록
+
+
+def _load_user_context(email):
+    employee = (
+        hrdatabase_employee.objects
+        .filter(email=email)
+        .values('employee_id', 'employee_name')
+        .first()
+    )
+    if not employee:
+        return None
+    team_ids = tuple(
+        hrdatabase_teammanagement.objects
+        .filter(employee_id=employee['employee_id'])
+        .values_list('team_id', flat=True)
+    )
+    return UserContext(
+        email=email,
+        employee_id=employee['employee_id'],
+        employee_name=employee['employee_name'],
+        team_ids=team_ids,
+    )
+
+
+def get_user_context(email):
+    """
+    로그인한 이메일의 UserContext (직원 + 소속 팀), 등록되지 않은 직원이면 None.
+    직원/팀 정보가 바뀌면 invalidate_user_contexts() 로, HR 데이터를 다시 적재하면 에이전트의
+    import_csv_data 가 같은 세대 번호를 올려 무효화된다. (공유 캐시 백엔드가 아니면 TTL 로 만료)
+    """
+    return cached_section(
+        'user_context', (email,),
+        lambda: _load_user_context(email),
+        source=EMPLOYEES,
+        timeout=USER_CONTEXT_TTL,
+    )
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    hrdatabase_attendancemanagement,
+    hrdatabase_employee,
+    hrdatabase_teammanagement,
+)
+from .services.cache_service import (
+    invalidate_attendance_sections,
+    invalidate_user_contexts,
+)
+
+# 챗봇 대화는 agent 프로세스(또는 Django 밖)에서 저장되므로 여기서 post_save 를 받을 수 없다.
+# 키워드 테이블 동기화와 대화 섹션 캐시 무효화는 refresh_chatbot_rollup 명령이 담당한다.
+
+
+@receiver(post_save, sender=hrdatabase_attendancemanagement)
+@receiver(post_delete, sender=hrdatabase_attendancemanagement)
+@receiver(post_save, sender=hrdatabase_employee)
+@receiver(post_delete, sender=hrdatabase_employee)
+@receiver(post_save, sender=hrdatabase_teammanagement)
+@receiver(post_delete, sender=hrdatabase_teammanagement)
+def roster_changed(sender, **kwargs):
+    # 직원/팀/근태가 바뀌면 직원 목록 섹션 캐시 무효화
+    invalidate_attendance_sections()
+
+
+@receiver(post_save, sender=hrdatabase_employee)
+@receiver(post_delete, sender=hrdatabase_employee)
+@receiver(post_save, sender=hrdatabase_teammanagement)
+@receiver(post_delete, sender=hrdatabase_teammanagement)
+def employee_changed(sender, **kwargs):
+    # 직원/팀이 바뀌면 로그인 사용자 정보 캐시 무효화
+    invalidate_user_contexts()
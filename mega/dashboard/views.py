@@ -1,21 +1,24 @@
-import ast
-from collections import Counter
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from allauth.socialaccount.models import SocialAccount
 from django.contrib.auth import logout
-from django.core.paginator import Paginator
-from django.db.models import Count, Q
-from datetime import datetime, timedelta, date
+from django.core.paginator import Page, Paginator
+from datetime import timedelta, date
 import calendar
 from config.settings import GOOGLE_CALENDAR_API_KEY, GOOGLE_CALENDAR_ID, MOCK_TODAY
 
-from .models import (
-    hrdatabase_employee,
-    hrdatabase_teammanagement,
-    hrdatabase_attendancemanagement,
-    hrdatabase_chatbotconversations
+from .services.cache_service import (
+    ATTENDANCE,
+    CONVERSATIONS,
+    ROSTER_TTL,
+    cached_section,
+    months_between,
+    period_timeout,
 )
+from .services.keyword_service import get_top_keywords
+from .services.roster_service import get_roster_page
+from .services.stats_service import get_rejected_questions, get_weekly_question_stats
+from .services.user_context_service import get_user_context
 
 @login_required
 def login_check(request):
@@ -27,16 +30,15 @@ def login_check(request):
             return render(request, 'dashboard/error.html', {'error_message': '소셜 계정 정보를 찾을 수 없습니다.'})
 
         user_email = social_account.extra_data.get('email')
-        employee = hrdatabase_employee.objects.filter(email=user_email).first()
-        if not employee:
+        user_context = get_user_context(user_email)  # 직원 + 소속 팀 (캐시)
+        if not user_context:
             return render(request, 'dashboard/error.html', {'error_message': '등록되지 않은 직원입니다.'})
 
-        team_info = hrdatabase_teammanagement.objects.filter(employee_id=employee)
-        if not team_info.exists():
+        if not user_context.team_ids:
             return render(request, 'dashboard/error.html', {'error_message': '부서 정보가 없습니다.'})
 
         # 예시: 인사팀(TEAM01)이면 board_dev로
-        if team_info.filter(team_id='TEAM01').exists():
+        if 'TEAM01' in user_context.team_ids:
             return redirect('board_dev')
 
         return render(request, 'dashboard/error.html', {'error_message': '권한 없음: 해당 부서가 아닙니다.'})
@@ -129,37 +131,17 @@ def board_common(request, dept_slug):
         week_ranges.append((w_start, w_end))
         curr_monday += timedelta(weeks=1)
 
-    # 주별 데이터 조회
-    all_qs = (
-        hrdatabase_chatbotconversations.objects
-        .filter(question_date__range=(earliest_monday, latest_sunday))
-        .values('question_date', 'team_id__team_id')
+    # 주별 데이터 조회 (주 × 부서 소속 여부 GROUP BY 한 번)
+    weekly_stats = cached_section(
+        'weekly', (dept_slug, earliest_monday.isoformat()),
+        lambda: get_weekly_question_stats(team_ids, week_ranges),
+        source=CONVERSATIONS,
+        months=months_between(earliest_monday, latest_sunday),
+        timeout=period_timeout(latest_sunday, today),
     )
-
-    weekly_labels = []
-    weekly_team_questions = []
-    weekly_other_questions = []
-
-    for (w_start, w_end) in week_ranges:
-        label_start = w_start.strftime('%y/%m/%d')
-        label_end   = w_end.strftime('%y/%m/%d')
-        label = f"{label_start} ~ {label_end}"
-
-        # 해당팀 질문 수
-        team_count = sum(
-            1 for q in all_qs
-            if w_start <= q['question_date'] <= w_end and q['team_id__team_id'] in team_ids
-        )
-        # 전체 질문 수
-        total_count = sum(
-            1 for q in all_qs
-            if w_start <= q['question_date'] <= w_end
-        )
-        other_count = total_count - team_count
-
-        weekly_labels.append(label)
-        weekly_team_questions.append(team_count)
-        weekly_other_questions.append(other_count)
+    weekly_labels          = [w['label'] for w in weekly_stats]
+    weekly_team_questions  = [w['team_count'] for w in weekly_stats]
+    weekly_other_questions = [w['other_count'] for w in weekly_stats]
 
     # 이전/다음 버튼
     prev_available = (wpage >= 0)   # 예시 로직
@@ -206,23 +188,13 @@ def board_common(request, dept_slug):
         r_next_month = r_month + 1
 
     # (D) 실제 DB에서 반려 질문 조회
-    rejected_qs = (
-        hrdatabase_chatbotconversations.objects
-        .filter(
-            answer="해당 질문은 대답할 수 없습니다.",
-            team_id__team_id__in=team_ids,
-            question_date__range=(r_start_of_month, r_end_of_month)
-        )
-        .order_by('-question_date')
+    cleaned_rejected = cached_section(
+        'rejected', (dept_slug, r_year, r_month),
+        lambda: get_rejected_questions(team_ids, r_start_of_month, r_end_of_month),
+        source=CONVERSATIONS,
+        months=months_between(r_start_of_month, r_end_of_month),
+        timeout=period_timeout(r_end_of_month, today),
     )
-    cleaned_rejected = []
-    for obj in rejected_qs:
-        q_text = obj.question.lstrip() if obj.question else ""
-        cleaned_rejected.append({
-            'conversation_id': obj.conversation_id,
-            'question': q_text,
-            'question_date': obj.question_date,
-        })
 
     # -----------------------
     # 3) 키워드(질문) 월 이동 로직 (기존)
@@ -265,95 +237,50 @@ def board_common(request, dept_slug):
     # -----------------------
     # 4) 직원 목록, 정렬, 키워드 분석 등 기존 로직
     # -----------------------
-    dev_members = (
-        hrdatabase_teammanagement.objects
-        .filter(team_id__in=team_ids)
-        .select_related('employee_id')
-    )
-
-    processed_ids = set()
-    employee_data = []
-    for member in dev_members:
-        emp = member.employee_id
-        if emp.employee_id in processed_ids:
-            continue
-        processed_ids.add(emp.employee_id)
-
-        attendance = hrdatabase_attendancemanagement.objects.filter(employee_id=emp).first()
-        team_label = TEAM_MAP.get(member.team_id, member.team_id)
-        rank_label = RANK_MAP.get(emp.employee_level, emp.employee_level)
-
-        row_data = {
-            'employee_id': emp.employee_id,
-            'name': emp.employee_name,
-            'rank': rank_label,
-            'phone_number': emp.phone_number,
-            'email': emp.email,
-            'team_id': team_label,
-        }
-        if attendance:
-            row_data['monthly_late_days']   = attendance.monthly_late_days
-            row_data['total_late_days']     = attendance.total_late_days
-            row_data['total_absence_days']  = attendance.total_absence_days
-            row_data['remaining_annual_leave'] = attendance.remaining_annual_leave
-            row_data['total_annual_leave']  = attendance.total_annual_leave
-        else:
-            row_data['monthly_late_days']   = None
-            row_data['total_late_days']     = None
-            row_data['total_absence_days']  = None
-            row_data['remaining_annual_leave'] = None
-            row_data['total_annual_leave']  = None
-
-        employee_data.append(row_data)
-
-    # 서버 사이드 정렬
     sort_col = request.GET.get('sort_col')
     sort_dir = request.GET.get('sort_dir', 'none')
 
-    FIELD_MAP = {
-        '7':  'monthly_late_days',
-        '8':  'total_late_days',
-        '9':  'total_absence_days',
-        '10': 'remaining_annual_leave',
-    }
-    if sort_col in FIELD_MAP and sort_dir in ['asc', 'desc']:
-        field_name = FIELD_MAP[sort_col]
-        employee_data.sort(
-            key=lambda x: x[field_name] if x[field_name] is not None else 0,
-            reverse=(sort_dir == 'desc')
-        )
-
-    # 페이지네이션
-    paginator = Paginator(employee_data, 10)
-    page_obj = paginator.get_page(request.GET.get('page'))
+    # 정렬·페이지네이션(LIMIT/OFFSET)은 DB에서 처리하고, 현재 페이지 행만 가공
+    page_number = request.GET.get('page')
+    roster_page = cached_section(
+        'roster', (dept_slug, sort_col, sort_dir, page_number),
+        lambda: get_roster_page(team_ids, sort_col, sort_dir, page_number, per_page=10),
+        source=ATTENDANCE,
+        timeout=ROSTER_TTL,
+    )
+    # 캐시된 행 수만으로 페이지 네비게이션을 구성 (range는 실제 목록을 만들지 않음)
+    paginator = Paginator(range(roster_page['count']), 10)
+    page_obj = Page([
+        {
+            'employee_id': emp['employee_id'],
+            'name': emp['employee_name'],
+            'rank': RANK_MAP.get(emp['employee_level'], emp['employee_level']),
+            'phone_number': emp['phone_number'],
+            'email': emp['email'],
+            'team_id': TEAM_MAP.get(emp['team_code'], emp['team_code']),
+            'monthly_late_days': emp['monthly_late_days'],
+            'total_late_days': emp['total_late_days'],
+            'total_absence_days': emp['total_absence_days'],
+            'remaining_annual_leave': emp['remaining_annual_leave'],
+            'total_annual_leave': emp['total_annual_leave'],
+        }
+        for emp in roster_page['rows']
+    ], roster_page['number'], paginator)
 
     # 키워드: Top5 & Top10
-    keyword_qs = (
-        hrdatabase_chatbotconversations.objects
-        .filter(
-            team_id__team_id__in=team_ids,
-            question_date__range=(k_start, k_end)
-        )
-        .exclude(keyword__isnull=True)
-        .exclude(keyword__exact="")
+    # 일별 키워드 집계에서 GROUP BY keyword ORDER BY count LIMIT 10
+    top10 = cached_section(
+        'keywords', (dept_slug, kyear, kmonth),
+        lambda: get_top_keywords(team_ids, k_start, k_end, limit=10),
+        source=CONVERSATIONS,
+        months=months_between(k_start, k_end),
+        timeout=period_timeout(k_end, today),
     )
-    all_keywords = []
-    for obj in keyword_qs:
-        try:
-            parsed = ast.literal_eval(obj.keyword)
-            if isinstance(parsed, list):
-                all_keywords.extend(parsed)
-        except:
-            pass
-
-    from collections import Counter
-    counter = Counter(all_keywords)
-
-    top5 = counter.most_common(5)
+    top5 = top10[:5]
+
     top5_labels = [x[0] for x in top5]
     top5_values = [x[1] for x in top5]
 
-    top10 = counter.most_common(10)
     top10_labels = [x[0] for x in top10]
     top10_values = [x[1] for x in top10]
 
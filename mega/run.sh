@@ -4,6 +4,20 @@
 python manage.py makemigrations
 python manage.py migrate --no-input
 
+# managed = False HR 테이블의 대시보드 컬럼(is_rejected)/인덱스 적용
+# 이 컬럼을 읽는 코드가 뜨기 전에 끝나야 하므로 실패하면 서버를 띄우지 않음
+python manage.py apply_dashboard_indexes || exit 1
+
+# 대시보드 주별/키워드 차트가 읽는 집계 테이블을 전체 재집계한 뒤,
+# 새 대화는 ROLLUP_REFRESH_INTERVAL(초, 기본 300)마다 증분 반영
+python manage.py refresh_chatbot_rollup --full
+(
+    while true; do
+        sleep "${ROLLUP_REFRESH_INTERVAL:-300}"
+        python manage.py refresh_chatbot_rollup
+    done
+) &
+
 # static( css & js ) 적용
 python manage.py collectstatic --no-input
 
@@ -0,0 +1,105 @@
+import os
+import csv
+import time
+import zoneinfo
+from datetime import datetime
+from django.core.management.base import BaseCommand
+from agent.utils.date_parsing import parse_columns, parse_date, parse_datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATE_COLUMNS = ("date",)
+DATETIME_COLUMNS = (
+    "scheduled_check_in_date",
+    "actual_check_in_date",
+    "scheduled_check_out_date",
+    "actual_check_out_date",
+)
+
+
+def parse_per_value(rows):
+    """기존 방식: 값마다 strptime 과 ZoneInfo 생성"""
+    for row in rows:
+        for column in DATE_COLUMNS:
+            value = row[column]
+            row[column] = datetime.strptime(value, "%Y-%m-%d").date() if value else None
+        for column in DATETIME_COLUMNS:
+            value = row[column]
+            row[column] = (
+                datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(
+                    tzinfo=zoneinfo.ZoneInfo("Asia/Seoul")
+                )
+                if value
+                else None
+            )
+    return rows
+
+
+def parse_cached_columns(rows):
+    """캐시된 고정 포맷 파서로 컬럼 단위 변환 (import_csv_data 가 쓰는 방식)"""
+    parse_date.cache_clear()
+    parse_datetime.cache_clear()
+    return parse_columns(rows, DATE_COLUMNS, DATETIME_COLUMNS)
+
+
+def parse_pandas(rows):
+    """pandas.to_datetime 으로 컬럼 전체를 한 번에 변환"""
+    import pandas as pd
+
+    frame = pd.DataFrame(rows)
+    for column in DATE_COLUMNS:
+        parsed = pd.to_datetime(frame[column], format="%Y-%m-%d", errors="coerce")
+        frame[column] = [value.date() if not pd.isna(value) else None for value in parsed]
+    for column in DATETIME_COLUMNS:
+        parsed = pd.to_datetime(
+            frame[column], format="%Y-%m-%d %H:%M:%S", errors="coerce"
+        ).dt.tz_localize("Asia/Seoul")
+        frame[column] = [value.to_pydatetime() if not pd.isna(value) else None for value in parsed]
+    return frame.to_dict("records")
+
+
+class Command(BaseCommand):
+    help = "Compare date/datetime parsing strategies on the attendance record CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=os.path.join(os.getenv("CSV_PATH", "/path/to/csv/"), "출퇴근기록정보.csv"),
+            help="출퇴근기록정보 CSV 경로",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+
+    def handle(self, *args, **options):
+        with open(options["file"], "r", encoding="utf-8-sig", newline="") as csvfile:
+            source = list(csv.DictReader(csvfile))
+        self.stdout.write(f"{len(source)} rows x {options['repeat']} runs")
+
+        strategies = [("per-value strptime", parse_per_value), ("cached columnar", parse_cached_columns)]
+        try:
+            import pandas  # noqa: F401
+            strategies.append(("pandas to_datetime", parse_pandas))
+        except ImportError:
+            self.stdout.write(self.style.WARNING("pandas not installed, skipping"))
+
+        baseline = None
+        expected = None
+        for label, parse in strategies:
+            best = float("inf")
+            for _ in range(options["repeat"]):
+                rows = [dict(row) for row in source]
+                started = time.perf_counter()
+                parsed = parse(rows)
+                best = min(best, time.perf_counter() - started)
+
+            values = [[row[c] for c in DATE_COLUMNS + DATETIME_COLUMNS] for row in parsed]
+            if expected is None:
+                expected = values
+            elif values != expected:
+                self.stdout.write(self.style.ERROR(f"{label}: results differ from per-value parsing"))
+
+            baseline = baseline or best
+            self.stdout.write(
+                f"{label:<20} best {best * 1000:8.1f} ms  "
+                f"({len(source) / best:,.0f} rows/s, x{baseline / best:.1f})"
+            )
@@ -1,228 +1,322 @@
 import os
-import csv
-import zoneinfo
-from django.core.management.base import BaseCommand
+import json
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+from django.core.management.base import BaseCommand, CommandError
 from agent.models import (
     hrdatabase_hrmastercode,
     hrdatabase_employee,
-    hrdatabase_welfarebenefits,
+    hrdatabase_welfarepoints,
     hrdatabase_welfarebenefits,
     hrdatabase_attendancemanagement,
     hrdatabase_attendancerecord,
     hrdatabase_teammanagement,
 )
-from datetime import datetime
+from agent.services.identity_service import identity_cache
+from agent.services.import_service import ImportCheckpoint, RowHashStore, TableSpec, import_tables
+from agent.services.master_code_service import master_codes
+from agent.services.user_context_service import invalidate_user_context
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-def open_csv_file(filepath):
-    """파일을 열고 BOM 제거"""
-    with open(filepath, "r", encoding="utf-8-sig") as csvfile:
-        reader = csv.DictReader(csvfile)
-        # 파일 핸들 유지 필요하므로 리스트로 반환
-        return list(reader)
+def parse_bool(value):
+    return str(value).strip().lower() == "true"
+
+
+def parse_int(value):
+    return int(value) if value not in (None, "") else None
+
+
+def parse_decimal(value):
+    try:
+        return Decimal(value) if value not in (None, "") else None
+    except InvalidOperation:
+        return None
 
 
 class Command(BaseCommand):
     help = "Import data from CSV files into the database"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 읽고 커밋할 행 수",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="체크포인트에 기록된 마지막 커밋 이후부터 이어서 적재",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            help="체크포인트 파일 경로 (기본: CSV_PATH/.import_checkpoint.json)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="동시에 적재할 테이블 수 (1 이면 순차 적재)",
+        )
+        parser.add_argument(
+            "--delta",
+            action="store_true",
+            help="이전 적재와 내용이 같은 파일/행은 건너뛰고 바뀐 행만 반영",
+        )
+        parser.add_argument(
+            "--delete-missing",
+            action="store_true",
+            help="CSV 에 없는 키의 행을 테이블에서 삭제 (--delta 필요)",
+        )
+
     def handle(self, *args, **kwargs):
         base_csv_path = os.getenv("CSV_PATH", "/path/to/csv/")
+        batch_size = kwargs["batch_size"]
+
+        checkpoint = ImportCheckpoint(
+            kwargs["checkpoint"] or os.path.join(base_csv_path, ".import_checkpoint.json")
+        )
+        if not kwargs["resume"]:
+            checkpoint.clear()
+        if kwargs["delete_missing"] and not kwargs["delta"]:
+            raise CommandError("--delete-missing 은 --delta 와 함께 사용해야 합니다.")
+        # delta 모드에서만 행 해시를 비교/기록
+        hashes = (
+            RowHashStore(os.path.join(base_csv_path, ".import_hashes.sqlite3"))
+            if kwargs["delta"]
+            else None
+        )
+
+        # 데이터베이스 삽입: 직원 테이블이 끝나면 직원 FK 를 가진 테이블들이 동시에 적재됨
+        self.employee_ids = None
+        self.employee_ids_lock = threading.Lock()
+        started = time.perf_counter()
+        total_table_seconds = 0.0
+        for result in import_tables(
+            self.table_specs(),
+            base_csv_path,
+            workers=kwargs["workers"],
+            batch_size=batch_size,
+            checkpoint=checkpoint,
+            hashes=hashes,
+            delete_missing=kwargs["delete_missing"],
+        ):
+            total_table_seconds += result.seconds
+            self.stdout.write(self.style.SUCCESS(f"Imported {result.table} data. {result.summary()}"))
+        self.stdout.write(
+            f"Import finished in {time.perf_counter() - started:.2f}s "
+            f"(sum of table times {total_table_seconds:.2f}s)"
+        )
+
+        # 모든 테이블이 끝났으므로 다음 실행은 처음부터
+        checkpoint.clear()
 
-        # 각 CSV 파일 경로 설정
-        file_paths = {
-            "common_code": os.path.join(base_csv_path, "공통코드.csv"),
-            "hrdatabase_employee": os.path.join(base_csv_path, "직원정보.csv"),
-            "welfare_points": os.path.join(base_csv_path, "복지포인트관리.csv"),
-            "welfare_benefits": os.path.join(base_csv_path, "복지혜택관리.csv"),
-            "attendance_management": os.path.join(base_csv_path, "근태관리.csv"),
-            "attendance_record": os.path.join(base_csv_path, "출퇴근기록정보.csv"),
-            "team_management": os.path.join(base_csv_path, "팀관리.csv"),
-        }
-
-        # 데이터베이스 삽입 함수 호출
-        self.import_common_code(file_paths["common_code"])
-        self.import_hrdatabase_employee(file_paths["employee"])
-        self.import_welfare_points(file_paths["welfare_points"])
-        self.import_welfare_benefits(file_paths["welfare_benefits"])
-        self.import_attendance_management(file_paths["attendance_management"])
-        self.import_attendance_record(file_paths["attendance_record"])
-        self.import_team_management(file_paths["team_management"])
-
-    def parse_date(self, date_string):
-        if not date_string:
+        # 직원/Slack ID 매핑과 공통 코드가 바뀌었을 수 있으므로 캐시 무효화
+        identity_cache.invalidate()
+        master_codes.invalidate()
+        invalidate_user_context()
+
+    def table_specs(self):
+        return [
+            TableSpec(
+                name="common_code",
+                model=hrdatabase_hrmastercode,
+                filename="공통코드.csv",
+                build=self.build_common_code,
+                key_fields=["code"],
+                update_fields=["parent_code", "code_name", "code_description"],
+            ),
+            TableSpec(
+                name="hrdatabase_employee",
+                model=hrdatabase_employee,
+                filename="직원정보.csv",
+                build=self.build_employee,
+                key_fields=["employee_id"],
+                update_fields=[
+                    "slack_id", "employee_name", "employee_level", "employment_type",
+                    "email", "password", "phone_number", "address", "hire_date",
+                    "tenure", "age", "gender", "reserve_military", "family_info",
+                    "child_info", "child_age", "home_ownership",
+                ],
+                date_columns=("hire_date",),
+            ),
+            TableSpec(
+                name="welfare_points",
+                model=hrdatabase_welfarepoints,
+                filename="복지포인트관리.csv",
+                build=self.build_welfare_points,
+                key_fields=["employee_id", "point_date"],
+                update_fields=["total_points", "used_points", "remaining_points", "expiration_date"],
+                date_columns=("point_date", "expiration_date"),
+            ),
+            TableSpec(
+                name="welfare_benefits",
+                model=hrdatabase_welfarebenefits,
+                filename="복지혜택관리.csv",
+                build=self.build_welfare_benefits,
+                key_fields=["employee_id"],
+                update_fields=[
+                    "childcare_used", "childcare_date", "company_housing",
+                    "housing_funding", "student_aid", "student_loan",
+                ],
+            ),
+            TableSpec(
+                name="attendance_management",
+                model=hrdatabase_attendancemanagement,
+                filename="근태관리.csv",
+                build=self.build_attendance_management,
+                key_fields=["employee_id"],
+                update_fields=[
+                    "total_late_days", "monthly_late_days", "monthly_total_late_time",
+                    "average_late_time", "total_absence_days", "total_annual_leave",
+                    "remaining_annual_leave",
+                ],
+            ),
+            TableSpec(
+                name="attendance_record",
+                model=hrdatabase_attendancerecord,
+                filename="출퇴근기록정보.csv",
+                build=self.build_attendance_record,
+                key_fields=["record_id"],
+                update_fields=[
+                    "employee_id", "date", "scheduled_check_in_date", "actual_check_in_date",
+                    "scheduled_check_out_date", "actual_check_out_date", "late_minutes",
+                    "is_late", "is_absent", "late_or_absent_reason",
+                ],
+                date_columns=("date",),
+                datetime_columns=(
+                    "scheduled_check_in_date", "actual_check_in_date",
+                    "scheduled_check_out_date", "actual_check_out_date",
+                ),
+            ),
+            TableSpec(
+                name="team_management",
+                model=hrdatabase_teammanagement,
+                filename="팀관리.csv",
+                build=self.build_team_management,
+                key_fields=["employee_id"],
+                update_fields=["team_id", "department", "team_leader"],
+            ),
+        ]
+
+    def employee_exists(self, row):
+        """CSV 행의 employee_id 가 직원 테이블에 있는지 (없으면 오류 출력)"""
+        if self.employee_ids is None:
+            # 직원 테이블 적재가 끝난 뒤 처음 호출될 때 한 번만 조회
+            with self.employee_ids_lock:
+                if self.employee_ids is None:
+                    self.employee_ids = set(
+                        hrdatabase_employee.objects.values_list("employee_id", flat=True)
+                    )
+        employee_id = parse_int(row["employee_id"])
+        if employee_id in self.employee_ids:
+            return True
+        self.stdout.write(
+            self.style.ERROR(f"Employee not found: {row['employee_id']}")
+        )
+        return False
+
+    def build_common_code(self, row):
+        return hrdatabase_hrmastercode(
+            code=row["코드"],
+            parent_code=row["상위코드"] or None,
+            code_name=row["코드명칭"],
+            code_description=row["코드 설명"] or None,
+        )
+
+    def build_employee(self, row):
+        return hrdatabase_employee(
+            employee_id=int(row["employee_id"]),
+            slack_id=row["slack_id"],
+            employee_name=row["name"],
+            employee_level=row["rank"],
+            employment_type=row["employment_type"],
+            email=row["email"],
+            password=row["password"],
+            phone_number=row["phone_number"],
+            address=row["address"],
+            hire_date=row["hire_date"],
+            tenure=parse_int(row["tenure"]),
+            age=parse_int(row["age"]),
+            gender=row["gender"],
+            reserve_military=row["reserve_military"],
+            family_info=row["family_info"],
+            child_info=parse_int(row["child_info"]),
+            child_age=json.loads(row["child_age"]) if row["child_age"] else None,
+            home_ownership=row["home_ownership"],
+        )
+
+    def build_welfare_points(self, row):
+        if not self.employee_exists(row):
             return None
-        try:
-            return datetime.strptime(date_string, "%Y-%m-%d").date()
-        except ValueError:
+        return hrdatabase_welfarepoints(
+            employee_id_id=int(row["employee_id"]),
+            point_date=row["point_date"],
+            total_points=parse_int(row["total_points"]) or 0,
+            used_points=parse_int(row["used_points"]) or 0,
+            remaining_points=parse_int(row["remaining_points"]) or 0,
+            expiration_date=row["expiration_date"],
+        )
+
+    def build_welfare_benefits(self, row):
+        if not self.employee_exists(row):
             return None
+        return hrdatabase_welfarebenefits(
+            employee_id_id=int(row["employee_id"]),
+            childcare_used=parse_bool(row["childcare_used"]),
+            childcare_date=parse_int(row["childcare_date"]),
+            company_housing=parse_bool(row["company_housing"]),
+            housing_funding=parse_bool(row["housing_funding"]),
+            student_aid=parse_int(row["student_aid"]),
+            student_loan=parse_bool(row["student_loan"]),
+        )
 
-    def parse_datetime(self, datetime_string):
-        if not datetime_string:
+    def build_attendance_management(self, row):
+        if not self.employee_exists(row):
             return None
-        try:
-            naive_dt = datetime.strptime(datetime_string, "%Y-%m-%d %H:%M:%S")
-            seoul_tz = zoneinfo.ZoneInfo("Asia/Seoul")
-            return naive_dt.replace(tzinfo=seoul_tz)
-        except ValueError:
+        return hrdatabase_attendancemanagement(
+            employee_id_id=int(row["employee_id"]),
+            total_late_days=parse_int(row["total_late_days"]) or 0,
+            monthly_late_days=parse_int(row["monthly_late_days"]) or 0,
+            monthly_total_late_time=parse_int(row["monthly_total_late_time"]) or 0,
+            average_late_time=parse_decimal(row["average_late_time"]) or 0,
+            total_absence_days=parse_int(row["total_absence_days"]) or 0,
+            total_annual_leave=parse_int(row["total_annual_leave"]) or 0,
+            remaining_annual_leave=parse_int(row["remaining_annual_leave"]) or 0,
+        )
+
+    def build_attendance_record(self, row):
+        if not self.employee_exists(row):
             return None
+        return hrdatabase_attendancerecord(
+            record_id=int(row["record_id"]),
+            employee_id_id=int(row["employee_id"]),
+            date=row["date"],
+            scheduled_check_in_date=row["scheduled_check_in_date"],
+            actual_check_in_date=row["actual_check_in_date"],
+            scheduled_check_out_date=row["scheduled_check_out_date"],
+            actual_check_out_date=row["actual_check_out_date"],
+            late_minutes=parse_int(row["late_minutes"]),
+            is_late=parse_bool(row["is_late"]),
+            is_absent=parse_bool(row["is_absent"]),
+            late_or_absent_reason=(
+                row["late_or_absent_reason"].strip()
+                if row["late_or_absent_reason"]
+                else None
+            ),
+        )
 
-    def import_common_code(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            hrdatabase_hrmastercode.objects.update_or_create(
-                code=row["코드"],
-                defaults={
-                    "parent_code": row["상위코드"] or None,
-                    "code_name": row["코드명칭"],
-                    "code_description": row["코드 설명"] or None,
-                },
-            )
-        self.stdout.write(self.style.SUCCESS("Imported hrdatabase_hrmastercode data."))
-
-    def import_hrdatabase_employee(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            hrdatabase_employee.objects.update_or_create(
-                employee_id=row["employee_id"],
-                defaults={
-                    "slack_id": row["slack_id"],
-                    "name": row["name"],
-                    "employee_level": row["employee_level"],
-                    "employment_type": row["employment_type"],
-                    "email": row["email"],
-                    "password": row["password"],
-                    "phone_number": row["phone_number"],
-                    "address": row["address"],
-                    "hire_date": self.parse_date(row["hire_date"]),
-                    "tenure": row["tenure"],
-                    "age": row["age"],
-                    "gender": row["gender"],
-                    "reserve_military": row["reserve_military"],
-                    "family_info": row["family_info"],
-                    "child_info": row["child_info"],
-                    "child_age": row["child_age"],
-                    "home_ownership": row["home_ownership"],
-                },
-            )
-        self.stdout.write(self.style.SUCCESS("Imported hrdatabase_employee data."))
-
-    def import_welfare_points(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            employee = hrdatabase_employee.objects.get(employee_id=row["employee_id"])
-            hrdatabase_welfarebenefits.objects.update_or_create(
-                employee=employee,
-                point_date=self.parse_date(row["point_date"]),
-                defaults={
-                    "total_points": row["total_points"],
-                    "used_points": row["used_points"],
-                    "remaining_points": row["remaining_points"],
-                    "expiration_date": self.parse_date(row["expiration_date"]),
-                },
-            )
-        self.stdout.write(self.style.SUCCESS("Imported Welfare Points data."))
-
-    def import_welfare_benefits(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            try:
-                employee = hrdatabase_employee.objects.get(employee_id=row["employee_id"])
-                hrdatabase_welfarebenefits.objects.update_or_create(
-                    employee=employee,
-                    defaults={
-                        "childcare_used": row["childcare_used"],
-                        "childcare_date": self.parse_date(row["childcare_date"]),
-                        "company_housing": row["company_housing"],
-                        "housing_funding": row["housing_funding"],
-                        "student_aid": row["student_aid"],
-                        "student_loan": row["student_loan"],
-                    },
-                )
-            except hrdatabase_employee.DoesNotExist:
-                self.stdout.write(
-                    self.style.ERROR(f"hrdatabase_employee not found: {row['employee_id']}")
-                )
-                continue
-        self.stdout.write(self.style.SUCCESS("Imported Welfare Benefits data."))
-
-    def import_attendance_management(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            employee = hrdatabase_employee.objects.get(employee_id=row["employee_id"])
-            hrdatabase_attendancemanagement.objects.update_or_create(
-                employee=employee,
-                defaults={
-                    "total_late_days": row["total_late_days"],
-                    "monthly_late_days": row["monthly_late_days"],
-                    "monthly_total_late_time": row["monthly_total_late_time"],
-                    "average_late_time": row["average_late_time"],
-                    "total_absence_days": row["total_absence_days"],
-                    "total_annual_leave": row["total_annual_leave"],
-                    "remaining_annual_leave": row["remaining_annual_leave"],
-                },
-            )
-        self.stdout.write(self.style.SUCCESS("Imported Attendance Management data."))
-
-    def import_attendance_record(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            try:
-                employee = hrdatabase_employee.objects.get(employee_id=row["employee_id"])
-                hrdatabase_attendancerecord.objects.update_or_create(
-                    record_id=int(row["record_id"]),
-                    defaults={
-                        "employee": employee,
-                        "date": self.parse_date(row["date"]),
-                        "scheduled_check_in_date": self.parse_datetime(
-                            row["scheduled_check_in_date"]
-                        ),
-                        "actual_check_in_date": self.parse_datetime(
-                            row["actual_check_in_date"]
-                        ),
-                        "scheduled_check_out_date": self.parse_datetime(
-                            row["scheduled_check_out_date"]
-                        ),
-                        "actual_check_out_date": self.parse_datetime(
-                            row["actual_check_out_date"]
-                        ),
-                        "late_minutes": (
-                            int(row["late_minutes"]) if row["late_minutes"] else None
-                        ),
-                        "is_late": row["is_late"].strip().lower() == "true",
-                        "is_absent": row["is_absent"].strip().lower() == "true",
-                        "late_or_absent_reason": (
-                            row["late_or_absent_reason"].strip()
-                            if row["late_or_absent_reason"]
-                            else None
-                        ),
-                    },
-                )
-            except hrdatabase_employee.DoesNotExist:
-                self.stdout.write(
-                    self.style.ERROR(f"Employee not found: {row['employee_id']}")
-                )
-                continue
-        self.stdout.write(self.style.SUCCESS("Imported Attendance Record data."))
-
-    def import_team_management(self, filepath):
-        reader = open_csv_file(filepath)
-        for row in reader:
-            try:
-                employee = hrdatabase_employee.objects.get(employee_id=row["employee_id"])
-                hrdatabase_teammanagement.objects.update_or_create(
-                    team_id=row["team_id"],  # team_id 필터 추가
-                    employee=employee,  # employee 필터 추가
-                    defaults={
-                        "department_id": row["department_id"],
-                        "team_leader": row["team_leader"].lower() == "true",
-                    },
-                )
-            except hrdatabase_employee.DoesNotExist:
-                self.stdout.write(
-                    self.style.ERROR(f"Employee not found: {row['employee_id']}")
-                )
-                continue
-        self.stdout.write(self.style.SUCCESS("Imported Team Management data."))
+    def build_team_management(self, row):
+        if not self.employee_exists(row):
+            return None
+        return hrdatabase_teammanagement(
+            team_id=row["team_id"],
+            employee_id_id=int(row["employee_id"]),
+            department=row["department_id"],
+            team_leader=parse_bool(row["team_leader"]),
+        )
@@ -1,6 +1,5 @@
 import time
 import logging
-import requests
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
@@ -14,67 +13,170 @@ from slack_sdk.errors import SlackApiError
 # 기존 handle_slack_event 함수: 사용자 메시지를 처리해 답변을 생성하는 로직
 # (세부 내용은 agent/views.py 안에 있다고 가정)
 from agent.views import handle_slack_event
+from agent.services.identity_service import identity_cache
+from agent.utils.db_connection import db_task
+from agent.utils.event_dedup import build_event_deduplicator
+from agent.utils.event_dispatcher import EventDispatcher
+from agent.utils.slack_transport import get_slack_transport
 
 logger = logging.getLogger("agent")
 logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
 console_handler = logging.StreamHandler()
 logger.addHandler(console_handler)
 
-processed_events = set()
+# 이미 처리한 event_id (TTL/크기 제한, 설정에 따라 공유 캐시 사용)
+processed_events = build_event_deduplicator()
 
 
-def get_user_id_by_email(email):
-    headers = {
-        "Authorization": f"Bearer {settings.SLACK_BOT_TOKEN}",
-        "Content-type": "application/json; charset=utf-8",
-    }
-    url = f"https://slack.com/api/users.lookupByEmail?email={email}"
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        data = response.json()
-        if data.get("ok"):
-            return data["user"]["id"]
+# 워커 풀 지표를 로그로 남기는 간격(초)
+METRICS_LOG_INTERVAL = 60
+
+
+def answer_event(user_message, user_id, channel_id):
+    """오래 떠 있는 프로세스에서 DB 연결 재사용/상태 확인을 거쳐 답변 생성"""
+    with db_task("slack_event"):
+        return handle_slack_event(user_message, user_id, channel_id)
+
+
+def handle_event(event: dict):
+    """
+    events_api 이벤트 하나를 처리한다. (워커 스레드에서 실행)
+    답변 생성(LLM/DB)이 오래 걸려도 Socket Mode 수신 루프를 막지 않는다.
+    """
+    slack = get_slack_transport()
+    event_type = event.get("type", "")
+    channel_id = event.get("channel", "")
+    user_id = event.get("user", "")
+    user_message = event.get("text", "")
+    event_ts = event.get("ts", None)
+    channel_type = event.get("channel_type", "")
+
+    ################################################################
+    # (1) @앱 맨션을 받았을 때 (예: 채널)
+    ################################################################
+    if event_type == "app_mention":
+        logger.debug(
+            f"[process] Mention received: user_id={user_id}, text={user_message}"
+        )
+
+        # 1) 메시지가 '!'로 끝나면 DM 로직
+        if user_message.strip().endswith("!"):
+            # handle_slack_event로 답변 생성
+            response_text = answer_event(
+                user_message, user_id, channel_id
+            )
+
+            if response_text:
+                # DM 전송
+                send_dm(user_id, response_text)
+
+            # 채널에는 일반 메시지로 "DM으로 답변을 보냈습니다."
+            try:
+                slack.post_message(channel_id, "DM으로 답변을 보냈습니다.")
+            except SlackApiError as e:
+                logger.error(
+                    f"[process] Failed to notify channel: {e.response['error']}",
+                    exc_info=True,
+                )
+
+        # 2) 메시지가 '!'로 끝나지 않을 때 → 스레드 답변
         else:
-            logger.error(f"Error fetching user ID: {data.get('error')}")
-    else:
-        logger.error(f"HTTP Error while fetching user ID: {response.status_code}")
-    return None
+            response_text = answer_event(
+                user_message, user_id, channel_id
+            )
+            if response_text:
+                try:
+                    # "로딩 중..." 메시지 없이 바로 스레드에 답변
+                    slack.post_message(
+                        channel_id, response_text, thread_ts=event_ts
+                    )
+                except SlackApiError as e:
+                    logger.error(
+                        f"[process] Failed to send Slack channel message: {e.response['error']}",
+                        exc_info=True,
+                    )
+
+    ################################################################
+    # (2) DM(1:1 대화) 로직
+    ################################################################
+    elif event_type == "message" and channel_type == "im":
+        logger.debug(
+            f"[process] DM received: user={user_id}, text={user_message}"
+        )
+
+        # DM에서는 기존 로직 그대로 "로딩 중" -> 최종 답변 업데이트
+        try:
+            loading_res = slack.post_message(
+                channel_id, "적합한 자료를 모으는 중..."
+            )
+            loading_ts = loading_res["ts"]
+        except SlackApiError as e:
+            logger.error(
+                f"[process] Failed to send loading (DM) message: {e.response['error']}",
+                exc_info=True,
+            )
+            return
+
+        # 최종 답변 생성
+        response_text = answer_event(
+            user_message, user_id, channel_id
+        )
+        if response_text:
+            try:
+                slack.update_message(
+                    channel_id, loading_ts, response_text
+                )
+            except SlackApiError as e:
+                logger.error(
+                    f"[process] Failed to send Slack DM: {e.response['error']}",
+                    exc_info=True,
+                )
+
+    # 그 외 이벤트는 무시 (채널 일반 메시지, 파일 업로드 등)
+
+
+def get_user_id_by_email(email):
+    # 시작 시 채워 둔 identity 캐시에서 조회 (없을 때만 users.lookupByEmail 호출)
+    return identity_cache.slack_id_for_email(email)
 
 
 def send_dm(user_id, message):
     """
     DM을 보낼 때는 보통 chat.postMessage로 channel=user_id.
     """
-    headers = {
-        "Authorization": f"Bearer {settings.SLACK_BOT_TOKEN}",
-        "Content-type": "application/json; charset=utf-8",
-    }
-    url = "https://slack.com/api/chat.postMessage"
-    payload = {
-        "channel": user_id,
-        "text": message,
-    }
-    response = requests.post(url, headers=headers, json=payload)
-    if response.status_code == 200:
-        data = response.json()
-        if data.get("ok"):
-            logger.info("Message sent successfully.")
-        else:
-            logger.error(f"Error sending DM: {data.get('error')}")
-    else:
-        logger.error(f"HTTP Error while sending DM: {response.status_code}")
+    try:
+        get_slack_transport().post_message(user_id, message)
+        logger.info("Message sent successfully.")
+    except SlackApiError as e:
+        logger.error(f"Error sending DM: {e.response['error']}")
 
 
 class Command(BaseCommand):
     help = "Run Slack Socket Mode client with extra debugging logs."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "SLACK_WORKER_CONCURRENCY", 4),
+            help="이벤트를 동시에 처리할 워커 스레드 수",
+        )
+        parser.add_argument(
+            "--queue-size",
+            type=int,
+            default=getattr(settings, "SLACK_WORKER_QUEUE_SIZE", 50),
+            help="워커별 대기 큐 크기 (가득 차면 새 요청을 거절)",
+        )
+
     def handle(self, *args, **options):
         logger.info("Initializing Slack WebClient with SLACK_BOT_TOKEN...")
 
+        # WebClient 는 SocketModeClient 연결용으로만 쓰고, 나머지 Web API 호출은 공용 transport 사용
         web_client = WebClient(token=settings.SLACK_BOT_TOKEN)
+        slack = get_slack_transport()
 
         try:
-            auth_test_response = web_client.auth_test()
+            auth_test_response = slack.api_call("auth.test")
             logger.info(f"[startup] auth_test ok => {auth_test_response}")
         except SlackApiError as e:
             logger.error(
@@ -82,6 +184,17 @@ class Command(BaseCommand):
             )
             return
 
+        # email <-> slack_id <-> employee_id 매핑을 미리 채워 메시지마다 조회하지 않도록 함
+        with db_task("identity_warmup"):
+            identity_cache.warm()
+
+        dispatcher = EventDispatcher(
+            workers=options["workers"], queue_size=options["queue_size"]
+        )
+        logger.info(
+            f"[startup] worker pool: workers={options['workers']}, queue_size={options['queue_size']}"
+        )
+
         logger.info("Initializing Slack SocketModeClient with SLACK_APP_TOKEN...")
         socket_mode_client = SocketModeClient(
             app_token=settings.SLACK_APP_TOKEN, web_client=web_client
@@ -92,6 +205,11 @@ class Command(BaseCommand):
                 f"[process] SocketModeRequest => type: {req.type}, payload: {req.payload}"
             )
 
+            # Slack 재전송을 막기 위해 어떤 요청이든 먼저 ack
+            client.send_socket_mode_response(
+                SocketModeResponse(envelope_id=req.envelope_id)
+            )
+
             ################################################################
             # (0) Slash Command 처리 로직
             ################################################################
@@ -103,21 +221,16 @@ class Command(BaseCommand):
 
                     try:
                         # Slash Command 응답 (ephemeral로 보낼 경우 chat_postEphemeral 사용)
-                        client.web_client.chat_postEphemeral(
-                            channel=req.payload["channel_id"],
-                            user=req.payload["user_id"],
-                            text=f"관리자 페이지 링크: {admin_link}",
+                        slack.post_ephemeral(
+                            req.payload["channel_id"],
+                            req.payload["user_id"],
+                            f"관리자 페이지 링크: {admin_link}",
                         )
                     except SlackApiError as e:
                         logger.error(
                             f"[slash_commands] Failed to respond: {e.response['error']}",
                             exc_info=True,
                         )
-
-                # Slash Command 받은 뒤에는 반드시 ack 필요
-                client.send_socket_mode_response(
-                    SocketModeResponse(envelope_id=req.envelope_id)
-                )
                 return
 
             ################################################################
@@ -126,125 +239,46 @@ class Command(BaseCommand):
             if req.type == "events_api":
                 event = req.payload.get("event", {})
                 event_id = req.payload.get("event_id", "")
-                client.send_socket_mode_response(
-                    SocketModeResponse(envelope_id=req.envelope_id)
-                )
 
                 # 이미 처리한 event_id면 무시
-                if event_id in processed_events:
+                if not processed_events.first_seen(event_id):
                     logger.debug(
                         f"[process] Duplicate event_id={event_id}. Skipping this event."
                     )
                     return
-                processed_events.add(event_id)
 
-                bot_id = event.get("bot_id")
-                subtype = event.get("subtype")
                 # 봇 자신이 보낸 메시지, 또는 subtype이 있는 이벤트(파일 업로드 등)는 무시
-                if bot_id or subtype:
+                if event.get("bot_id") or event.get("subtype"):
                     return
 
-                event_type = event.get("type", "")
-                channel_id = event.get("channel", "")
+                # 같은 사용자의 메시지는 같은 워커에서 순서대로 처리
                 user_id = event.get("user", "")
-                user_message = event.get("text", "")
-                event_ts = event.get("ts", None)
-                channel_type = event.get("channel_type", "")
-
-                ################################################################
-                # (1) @앱 맨션을 받았을 때 (예: 채널)
-                ################################################################
-                if event_type == "app_mention":
-                    logger.debug(
-                        f"[process] Mention received: user_id={user_id}, text={user_message}"
-                    )
-
-                    # 1) 메시지가 '!'로 끝나면 DM 로직
-                    if user_message.strip().endswith("!"):
-                        # handle_slack_event로 답변 생성
-                        response_text = handle_slack_event(
-                            user_message, user_id, channel_id
-                        )
-
-                        if response_text:
-                            # DM 전송
-                            send_dm(user_id, response_text)
-
-                        # 채널에는 일반 메시지로 "DM으로 답변을 보냈습니다."
-                        try:
-                            client.web_client.chat_postMessage(
-                                channel=channel_id, text="DM으로 답변을 보냈습니다."
-                            )
-                        except SlackApiError as e:
-                            logger.error(
-                                f"[process] Failed to notify channel: {e.response['error']}",
-                                exc_info=True,
-                            )
-
-                    # 2) 메시지가 '!'로 끝나지 않을 때 → 스레드 답변
-                    else:
-                        response_text = handle_slack_event(
-                            user_message, user_id, channel_id
-                        )
-                        if response_text:
-                            try:
-                                # "로딩 중..." 메시지 없이 바로 스레드에 답변
-                                client.web_client.chat_postMessage(
-                                    channel=channel_id,
-                                    text=response_text,
-                                    thread_ts=event_ts,
-                                )
-                            except SlackApiError as e:
-                                logger.error(
-                                    f"[process] Failed to send Slack channel message: {e.response['error']}",
-                                    exc_info=True,
-                                )
-
-                ################################################################
-                # (2) DM(1:1 대화) 로직
-                ################################################################
-                elif event_type == "message" and channel_type == "im":
-                    logger.debug(
-                        f"[process] DM received: user={user_id}, text={user_message}"
-                    )
-
-                    # DM에서는 기존 로직 그대로 "로딩 중" -> 최종 답변 업데이트
+                accepted = dispatcher.submit(user_id, handle_event, event)
+                if not accepted:
                     try:
-                        loading_res = client.web_client.chat_postMessage(
-                            channel=channel_id, text="적합한 자료를 모으는 중..."
+                        slack.post_message(
+                            event.get("channel", ""),
+                            "요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.",
+                            thread_ts=event.get("ts"),
                         )
-                        loading_ts = loading_res["ts"]
                     except SlackApiError as e:
                         logger.error(
-                            f"[process] Failed to send loading (DM) message: {e.response['error']}",
+                            f"[process] Failed to send busy message: {e.response['error']}",
                             exc_info=True,
                         )
-                        return
-
-                    # 최종 답변 생성
-                    response_text = handle_slack_event(
-                        user_message, user_id, channel_id
-                    )
-                    if response_text:
-                        try:
-                            client.web_client.chat_update(
-                                channel=channel_id, ts=loading_ts, text=response_text
-                            )
-                        except SlackApiError as e:
-                            logger.error(
-                                f"[process] Failed to send Slack DM: {e.response['error']}",
-                                exc_info=True,
-                            )
-
-                # 그 외 이벤트는 무시 (채널 일반 메시지, 파일 업로드 등)
 
         # SocketModeClient에 이벤트 리스너 등록
         socket_mode_client.socket_mode_request_listeners.append(process)
         socket_mode_client.connect()
 
-        # 메인 루프 유지
+        # 메인 루프 유지 (주기적으로 워커 풀 지표 기록)
+        last_report = time.monotonic()
         try:
             while True:
                 time.sleep(1)
+                if time.monotonic() - last_report >= METRICS_LOG_INTERVAL:
+                    last_report = time.monotonic()
+                    logger.info(f"[dispatcher] {dispatcher.stats()}")
         except KeyboardInterrupt:
             logger.info("Socket Mode client stopped by KeyboardInterrupt.")
+            dispatcher.shutdown(wait=False)
@@ -1,5 +1,8 @@
 from django.db import models
 
+# 챗봇이 답변을 거절(반려)할 때 저장하는 고정 응답
+REJECTED_ANSWER = "해당 질문은 대답할 수 없습니다."
+
 # 공통 코드
 class hrdatabase_hrmastercode(models.Model):
     code = models.CharField(max_length=10, primary_key=True)
@@ -146,11 +149,17 @@ class hrdatabase_chatbotconversations(models.Model):
     question_date = models.DateField(null=True, blank=True)
     team_id = models.ForeignKey('hrdatabase_teammanagement', on_delete=models.CASCADE, db_column='team_id', to_field='team_id', null=True, blank=True)
     keyword = models.TextField(null=True, blank=True)
+    is_rejected = models.BooleanField(default=False, db_default=False)  # 반려 응답 여부 (컬럼은 mega 배포 시 apply_dashboard_indexes 가 추가)
     
     class Meta:
         db_table = 'hrdatabase_chatbotconversations'
         managed = False 
 
+    def save(self, *args, **kwargs):
+        # 대시보드가 TEXT answer 비교 없이 인덱스로 반려 질문을 찾도록 저장 시점에 플래그 기록
+        self.is_rejected = self.answer == REJECTED_ANSWER
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Conversation {self.conversation_id} - {self.team_id}"
 
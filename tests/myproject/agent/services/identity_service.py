@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from slack_sdk.errors import SlackApiError
+
+from agent.models import hrdatabase_employee
+from agent.utils.cache_generation import bump_generation, get_generation
+from agent.utils.slack_transport import get_slack_transport
+
+logger = logging.getLogger("agent")
+
+# users.list 한 페이지 크기
+SLACK_USERS_PAGE_SIZE = 200
+
+
+class IdentityCache:
+    """
+    email <-> slack_id <-> employee_id 양방향 매핑 캐시.
+
+    warm() 이 hrdatabase_employee.slack_id 와 Slack users.list 를 한 번에 읽어 채우고,
+    ttl 이 지나면 다음 조회 시 다시 채운다. 평소 메시지 처리에서는 네트워크/DB 조회 없이
+    메모리에서 답하고, 캐시에 없는 값만 개별 조회해 채워 넣는다.
+
+    매핑은 프로세스 메모리에 두지만 무효화는 import_csv_data·admin 등 다른 프로세스에서
+    일어나므로, invalidate() 는 Django 캐시의 세대 번호를 올리고 조회 때마다 채운 시점의
+    세대 번호와 비교한다. (UserContextCache 와 마찬가지로 공유 백엔드가 필요)
+    """
+
+    def __init__(self, ttl=3600, cache_alias="default", generation_key="agent:identity:gen"):
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+        self.generation_key = generation_key
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._generation = None
+        self._reset()
+
+    def _reset(self):
+        self.email_to_slack = {}
+        self.slack_to_email = {}
+        self.slack_to_employee = {}
+        self.employee_to_slack = {}
+        self._missing_slack_ids = set()  # DB 에 없는 것으로 확인된 slack_id
+
+    def warm(self):
+        """DB 와 Slack 사용자 목록으로 매핑 전체를 다시 채운다."""
+        with self._lock:
+            # 채우는 도중 올라간 세대 번호를 놓치지 않도록 읽기 전에 기록
+            self._generation = get_generation(self.generation_key, self.cache_alias)
+            self._reset()
+            for employee_id, email, slack_id in (
+                hrdatabase_employee.objects
+                .exclude(slack_id__isnull=True)
+                .exclude(slack_id="")
+                .values_list("employee_id", "email", "slack_id")
+            ):
+                self._remember(slack_id, email=email, employee_id=employee_id)
+
+            try:
+                for member in self._iter_slack_members():
+                    email = member.get("profile", {}).get("email")
+                    if email and not member.get("deleted") and not member.get("is_bot"):
+                        self._remember(member["id"], email=email)
+            except SlackApiError as e:
+                # Slack 조회가 실패해도 DB 매핑만으로 계속 동작
+                logger.error(f"[identity] users.list failed: {e.response['error']}")
+
+            self._loaded_at = time.monotonic()
+            logger.info(
+                f"[identity] warmed {len(self.slack_to_employee)} employees, "
+                f"{len(self.email_to_slack)} emails"
+            )
+
+    def invalidate(self):
+        """모든 프로세스가 다음 조회 때 전체를 다시 채우도록 캐시를 만료시킨다."""
+        bump_generation(self.generation_key, self.cache_alias)
+        with self._lock:
+            self._loaded_at = None
+
+    def slack_id_for_email(self, email):
+        self._ensure_fresh()
+        slack_id = self.email_to_slack.get(email)
+        if slack_id is None:
+            try:
+                slack_id = get_slack_transport().lookup_user_by_email(email)["user"]["id"]
+            except SlackApiError as e:
+                logger.error(f"Error fetching user ID: {e.response['error']}")
+                return None
+            with self._lock:
+                self._remember(slack_id, email=email)
+        return slack_id
+
+    def employee_id_for_slack_id(self, slack_id):
+        self._ensure_fresh()
+        employee_id = self.slack_to_employee.get(slack_id)
+        if employee_id is None and slack_id not in self._missing_slack_ids:
+            employee = (
+                hrdatabase_employee.objects
+                .filter(slack_id=slack_id)
+                .values_list("employee_id", "email")
+                .first()
+            )
+            with self._lock:
+                if employee is None:
+                    self._missing_slack_ids.add(slack_id)
+                else:
+                    employee_id, email = employee
+                    self._remember(slack_id, email=email, employee_id=employee_id)
+        return employee_id
+
+    def slack_id_for_employee_id(self, employee_id):
+        self._ensure_fresh()
+        return self.employee_to_slack.get(employee_id)
+
+    def _ensure_fresh(self):
+        if self._is_fresh():
+            return
+        with self._lock:
+            if not self._is_fresh():
+                self.warm()
+
+    def _is_fresh(self):
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at >= self.ttl:
+            return False
+        return get_generation(self.generation_key, self.cache_alias) == self._generation
+
+    def _remember(self, slack_id, email=None, employee_id=None):
+        if email:
+            self.email_to_slack[email] = slack_id
+            self.slack_to_email[slack_id] = email
+        if employee_id is not None:
+            self.slack_to_employee[slack_id] = employee_id
+            self.employee_to_slack[employee_id] = slack_id
+            self._missing_slack_ids.discard(slack_id)
+
+    def _iter_slack_members(self):
+        cursor = None
+        while True:
+            params = {"limit": SLACK_USERS_PAGE_SIZE}
+            if cursor:
+                params["cursor"] = cursor
+            data = get_slack_transport().api_call("users.list", http_method="GET", params=params)
+            yield from data.get("members", [])
+            cursor = data.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return
+
+
+identity_cache = IdentityCache(
+    ttl=getattr(settings, "IDENTITY_CACHE_TTL", 3600),
+    cache_alias=getattr(settings, "USER_CONTEXT_CACHE_ALIAS", "default"),
+)
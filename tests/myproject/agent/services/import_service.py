@@ -0,0 +1,451 @@
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Optional
+
+from django.db import connections, transaction
+
+from agent.utils.date_parsing import parse_columns
+from agent.utils.db_connection import db_task
+
+
+@dataclass
+class ImportResult:
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    seconds: float = 0.0
+    resumed_from: int = 0
+    file_unchanged: bool = False
+
+    @property
+    def rows(self):
+        return self.inserted + self.updated
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def add(self, other):
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.skipped += other.skipped
+
+    def summary(self):
+        if self.file_unchanged:
+            return f"{self.table}: source file unchanged, nothing to import"
+        text = (
+            f"{self.table}: {self.inserted} inserted, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {self.deleted} deleted, "
+            f"{self.skipped} skipped in {self.seconds:.2f}s ({self.rows_per_sec:.0f} rows/s)"
+        )
+        if self.resumed_from:
+            text += f", resumed after row {self.resumed_from}"
+        return text
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """CSV 파일 하나를 모델 하나로 적재하기 위한 설정"""
+    name: str
+    model: type
+    filename: str
+    build: Callable[[dict], Optional[object]]  # CSV 행 -> 모델 인스턴스 (건너뛸 행은 None)
+    key_fields: list
+    update_fields: list = field(default_factory=list)
+    date_columns: tuple = ()  # build 전에 date 로 변환할 CSV 컬럼
+    datetime_columns: tuple = ()  # build 전에 aware datetime 으로 변환할 CSV 컬럼
+
+
+def iter_csv_rows(filepath, skip=0):
+    """CSV 행을 하나씩 읽어 dict 로 반환 (BOM 제거, 앞의 skip 행은 건너뜀)"""
+    with open(filepath, "r", encoding="utf-8-sig", newline="") as csvfile:
+        yield from islice(csv.DictReader(csvfile), skip, None)
+
+
+def batched(iterable, size):
+    """iterable 을 size 개씩 묶은 리스트로 반환"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def row_digest(row):
+    """CSV 행(변환 전 문자열 값) 내용 해시"""
+    return hashlib.md5("\x1f".join(str(v) for v in row.values()).encode("utf-8")).hexdigest()
+
+
+def file_digest(filepath):
+    """CSV 파일 전체 내용 해시"""
+    digest = hashlib.md5()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def key_string(values):
+    """키 값 튜플을 해시 저장소에 넣을 수 있는 문자열로 변환"""
+    return json.dumps([str(v) for v in values], ensure_ascii=False)
+
+
+def bulk_upsert(model, objects, key_fields, update_fields, batch_size=500):
+    """
+    objects(저장 전 모델 인스턴스)를 key_fields 기준으로 삽입 또는 갱신한다.
+
+    1) objects 에 포함된 키의 기존 PK 를 한 번의 쿼리로 읽고
+    2) 새 키는 bulk_create, 기존 키는 PK 를 채워 bulk_update 로 나눠
+    3) batch_size 단위로 하나의 트랜잭션 안에서 적용한다.
+    같은 키가 여러 번 나오면 마지막 행을 사용한다.
+    """
+    started = time.perf_counter()
+    result = ImportResult(table=model._meta.db_table)
+
+    key_attnames = [model._meta.get_field(name).attname for name in key_fields]
+    pk_attname = model._meta.pk.attname
+
+    def key_of(obj):
+        return tuple(getattr(obj, attname) for attname in key_attnames)
+
+    latest = {}
+    for obj in objects:
+        latest[key_of(obj)] = obj
+    if not latest:
+        return result
+
+    # 첫 번째 키 컬럼으로 후보를 좁힌 뒤 전체 키로 매칭
+    candidates = {key[0] for key in latest}
+    existing = {
+        tuple(row[:-1]): row[-1]
+        for row in model.objects.filter(**{f"{key_fields[0]}__in": candidates})
+        .values_list(*key_fields, "pk")
+    }
+
+    inserts, updates = [], []
+    for key, obj in latest.items():
+        if key in existing:
+            setattr(obj, pk_attname, existing[key])
+            updates.append(obj)
+        else:
+            inserts.append(obj)
+
+    with transaction.atomic():
+        if inserts:
+            model.objects.bulk_create(inserts, batch_size=batch_size)
+        if updates and update_fields:
+            model.objects.bulk_update(updates, update_fields, batch_size=batch_size)
+
+    result.inserted = len(inserts)
+    result.updated = len(updates)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+class ImportCheckpoint:
+    """
+    테이블별로 커밋이 끝난 CSV 행 수를 JSON 파일에 기록한다.
+    파일 크기/수정 시각이 달라진 CSV 는 처음부터 다시 읽는다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._state = json.load(f)
+
+    @staticmethod
+    def _signature(filepath):
+        stat = os.stat(filepath)
+        return [stat.st_size, int(stat.st_mtime)]
+
+    def position(self, table, filepath):
+        """이어서 읽을 행 번호 (완료된 테이블이면 None)"""
+        entry = self._state.get(table)
+        if not entry or entry["signature"] != self._signature(filepath):
+            return 0
+        return None if entry["done"] else entry["rows"]
+
+    def save(self, table, filepath, rows, done=False):
+        with self._lock:
+            self._state[table] = {
+                "signature": self._signature(filepath),
+                "rows": rows,
+                "done": done,
+            }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def clear(self):
+        with self._lock:
+            self._state = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class RowHashStore:
+    """
+    delta 모드용 해시 저장소 (SQLite 파일).
+    테이블별 마지막 적재 파일 해시와, 행 키별 내용 해시 / 마지막으로 본 실행 번호를 기록한다.
+    청크마다 필요한 키만 조회/갱신하므로 CSV 크기와 무관하게 메모리 사용량이 일정하다.
+    """
+
+    # SQLite 한 쿼리의 바인딩 변수 수 제한보다 작게
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS file_hashes ("
+                "table_name TEXT PRIMARY KEY, file_hash TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS row_hashes ("
+                "table_name TEXT NOT NULL, row_key TEXT NOT NULL, "
+                "row_hash TEXT NOT NULL, run_id INTEGER NOT NULL, "
+                "PRIMARY KEY (table_name, row_key))"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def file_digest(self, table):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT file_hash FROM file_hashes WHERE table_name = ?", (table,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _select(self, sql, table, keys, *params):
+        found = {}
+        with self._connect() as conn:
+            for start in range(0, len(keys), self.LOOKUP_CHUNK):
+                chunk = keys[start:start + self.LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(conn.execute(
+                    sql.format(placeholders=placeholders), (table, *params, *chunk)
+                ).fetchall())
+        return found
+
+    def lookup(self, table, keys):
+        """keys 중 이전 적재 기록이 있는 키의 {키: 행 해시}"""
+        return self._select(
+            "SELECT row_key, row_hash FROM row_hashes "
+            "WHERE table_name = ? AND row_key IN ({placeholders})",
+            table, list(keys),
+        )
+
+    def seen(self, table, keys, run_id):
+        """keys 중 이번 실행(run_id)에서 CSV 에 있었던 키 집합"""
+        return set(self._select(
+            "SELECT row_key, run_id FROM row_hashes "
+            "WHERE table_name = ? AND run_id = ? AND row_key IN ({placeholders})",
+            table, list(keys), run_id,
+        ))
+
+    def record(self, table, row_hashes, run_id):
+        """[(키, 행 해시), ...] 를 이번 실행에서 본 행으로 기록 (청크가 커밋된 뒤 호출)"""
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO row_hashes (table_name, row_key, row_hash, run_id) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (table_name, row_key) DO UPDATE SET "
+                "row_hash = excluded.row_hash, run_id = excluded.run_id",
+                [(table, key, row_hash, run_id) for key, row_hash in row_hashes],
+            )
+
+    def finish(self, table, file_hash, run_id, prune=True):
+        """테이블 적재 완료: 파일 해시를 기록하고, prune 이면 이번 실행에 없던 키를 지운다."""
+        with self._lock, self._connect() as conn:
+            if prune:
+                conn.execute(
+                    "DELETE FROM row_hashes WHERE table_name = ? AND run_id != ?", (table, run_id)
+                )
+            conn.execute(
+                "INSERT INTO file_hashes (table_name, file_hash) VALUES (?, ?) "
+                "ON CONFLICT (table_name) DO UPDATE SET file_hash = excluded.file_hash",
+                (table, file_hash),
+            )
+
+
+def delete_missing_rows(model, key_fields, hashes, table, run_id, batch_size=500):
+    """이번 실행의 CSV 에 없던 키를 가진 행을 삭제하고 삭제한 행 수를 반환"""
+    stale = []
+    keys = model.objects.values_list(*key_fields, "pk").iterator(chunk_size=batch_size)
+    for chunk in batched(keys, batch_size):
+        key_to_pk = {key_string(row[:-1]): row[-1] for row in chunk}
+        seen = hashes.seen(table, list(key_to_pk), run_id)
+        stale.extend(pk for key, pk in key_to_pk.items() if key not in seen)
+
+    deleted = 0
+    with transaction.atomic():
+        for start in range(0, len(stale), batch_size):
+            _, by_model = model.objects.filter(pk__in=stale[start:start + batch_size]).delete()
+            deleted += by_model.get(model._meta.label, 0)
+    return deleted
+
+
+def import_table(spec, filepath, batch_size=500, checkpoint=None,
+                 hashes=None, delete_missing=False):
+    """
+    CSV 를 스트리밍으로 읽어 parse -> validate -> batch -> write 순서로 적재한다.
+    날짜/일시 컬럼은 청크마다 컬럼 단위로 변환한 뒤 spec.build 에 넘긴다.
+    batch_size 행마다 커밋하고 checkpoint 에 진행 위치를 기록하므로,
+    중단된 적재는 마지막으로 커밋된 청크 다음부터 이어서 진행할 수 있다.
+
+    hashes(RowHashStore) 가 있으면 delta 모드: 이전 적재와 내용이 같은 파일/행은 건너뛰고,
+    delete_missing=True 이면 CSV 에 없는 키의 행을 삭제한다.
+    """
+    started = time.perf_counter()
+    result = ImportResult(table=spec.model._meta.db_table)
+
+    start = checkpoint.position(spec.name, filepath) if checkpoint else 0
+    if start is None:
+        return result  # 이전 실행에서 이미 완료된 테이블
+    result.resumed_from = start
+
+    digest = None
+    run_id = time.time_ns()
+    if hashes:
+        digest = file_digest(filepath)
+        if start == 0 and digest == hashes.file_digest(spec.name):
+            result.file_unchanged = True
+            if checkpoint:
+                checkpoint.save(spec.name, filepath, 0, done=True)
+            return result
+
+    key_attnames = [spec.model._meta.get_field(name).attname for name in spec.key_fields]
+
+    position = start
+    for chunk in batched(iter_csv_rows(filepath, skip=start), batch_size):
+        digests = [row_digest(row) for row in chunk] if hashes else None
+        parse_columns(chunk, spec.date_columns, spec.datetime_columns)
+        built = []
+        for index, row in enumerate(chunk):
+            obj = spec.build(row)
+            if obj is None:
+                result.skipped += 1
+                continue
+            built.append((obj, digests[index] if hashes else None))
+
+        if hashes:
+            keyed = [
+                (key_string(getattr(obj, attname) for attname in key_attnames), obj, row_hash)
+                for obj, row_hash in built
+            ]
+            previous = hashes.lookup(spec.name, [key for key, _, _ in keyed])
+            objects = [obj for key, obj, row_hash in keyed if previous.get(key) != row_hash]
+            result.unchanged += len(keyed) - len(objects)
+        else:
+            objects = [obj for obj, _ in built]
+
+        result.add(bulk_upsert(
+            spec.model, objects, spec.key_fields, spec.update_fields, batch_size
+        ))
+        if hashes:
+            hashes.record(spec.name, [(key, row_hash) for key, _, row_hash in keyed], run_id)
+        position += len(chunk)
+        if checkpoint:
+            checkpoint.save(spec.name, filepath, position)
+
+    if hashes:
+        # 중간부터 이어서 읽은 경우 앞부분 키를 이번 실행에서 보지 못했으므로 삭제/정리하지 않음
+        if delete_missing and start == 0:
+            result.deleted = delete_missing_rows(
+                spec.model, spec.key_fields, hashes, spec.name, run_id, batch_size
+            )
+        hashes.finish(spec.name, digest, run_id, prune=start == 0)
+    if checkpoint:
+        checkpoint.save(spec.name, filepath, position, done=True)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def table_dependencies(specs):
+    """
+    모델의 FK/OneToOne 관계로 적재 순서 의존성을 구한다.
+    {테이블 이름: 먼저 적재되어야 하는 테이블 이름 집합}
+    """
+    name_by_model = {spec.model: spec.name for spec in specs}
+    dependencies = {}
+    for spec in specs:
+        dependencies[spec.name] = {
+            name_by_model[f.related_model]
+            for f in spec.model._meta.concrete_fields
+            if f.is_relation
+            and f.related_model in name_by_model
+            and f.related_model is not spec.model
+        }
+    return dependencies
+
+
+def _import_in_worker(spec, filepath, **options):
+    # 스레드마다 별도의 DB 연결을 쓰고, 끝나면 그 연결을 닫는다
+    try:
+        with db_task(f"import {spec.name}"):
+            return import_table(spec, filepath, **options)
+    finally:
+        connections.close_all()
+
+
+def import_tables(specs, base_path, workers=4, **options):
+    """
+    의존성이 모두 끝난 테이블부터 workers 개의 스레드로 동시에 적재한다.
+    완료되는 순서대로 ImportResult 를 반환하는 generator.
+    options 는 테이블마다 import_table 에 그대로 전달된다.
+    한 테이블이 실패하면 새 테이블은 더 시작하지 않고,
+    실행 중인 작업이 끝난 뒤 첫 번째 예외를 다시 발생시킨다.
+    """
+    specs_by_name = {spec.name: spec for spec in specs}
+    pending = table_dependencies(specs)
+    finished = set()
+    error = None
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="csv-import") as executor:
+        running = {}
+
+        def schedule():
+            for name, deps in list(pending.items()):
+                if deps <= finished:
+                    del pending[name]
+                    spec = specs_by_name[name]
+                    future = executor.submit(
+                        _import_in_worker, spec,
+                        os.path.join(base_path, spec.filename),
+                        **options,
+                    )
+                    running[future] = name
+
+        schedule()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    error = error or exc
+                    continue
+                finished.add(name)
+                yield result
+            if error is None:
+                schedule()
+
+    if error is not None:
+        raise error
+    if pending:
+        raise ValueError(f"Circular import dependency: {sorted(pending)}")
@@ -0,0 +1,72 @@
+import threading
+import time
+from types import MappingProxyType
+
+from django.conf import settings
+
+from agent.models import hrdatabase_hrmastercode
+from agent.utils.cache_generation import bump_generation, get_generation
+
+
+class MasterCodeRegistry:
+    """
+    hrdatabase_hrmastercode (공통 코드) 를 프로세스 메모리에 올려 두는 읽기 전용 사전.
+
+    코드 테이블은 수십 행이고 거의 바뀌지 않으므로 한 번 읽어 불변 매핑(MappingProxyType)으로
+    교체해 두고, 버전(Django 캐시의 세대 번호)이 바뀌거나 reload_interval 이 지나면 다시 읽는다.
+    invalidate() 는 버전을 올리므로 import_csv_data·admin 등 다른 프로세스에서 호출해도
+    공유 캐시 백엔드를 쓰는 run_socket_mode 가 다음 조회 때 새 코드를 읽는다.
+    """
+
+    def __init__(self, reload_interval=600, cache_alias="default", version_key="agent:master_codes:gen"):
+        self.reload_interval = reload_interval
+        self.cache_alias = cache_alias
+        self.version_key = version_key
+        self._lock = threading.Lock()
+        self._codes = MappingProxyType({})
+        self._version = None
+        self._loaded_at = None
+
+    @property
+    def version(self):
+        """현재 매핑을 읽을 때의 공유 버전 번호 (아직 읽지 않았으면 None)"""
+        return self._version
+
+    def snapshot(self):
+        """현재 버전의 {code: code_name} 불변 매핑"""
+        self._ensure_loaded()
+        return self._codes
+
+    def get_name(self, code, default=None):
+        return self.snapshot().get(code, default)
+
+    def invalidate(self):
+        bump_generation(self.version_key, self.cache_alias)
+        with self._lock:
+            self._loaded_at = None
+
+    def reload(self, version=None):
+        if version is None:
+            version = get_generation(self.version_key, self.cache_alias)
+        codes = dict(hrdatabase_hrmastercode.objects.values_list("code", "code_name"))
+        with self._lock:
+            self._codes = MappingProxyType(codes)
+            self._version = version
+            self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self):
+        # 읽기 전에 버전을 확인해 두므로, 읽는 도중 올라간 버전은 다음 조회에서 다시 읽는다
+        version = get_generation(self.version_key, self.cache_alias)
+        loaded_at = self._loaded_at
+        if (
+            loaded_at is None
+            or version != self._version
+            or time.monotonic() - loaded_at >= self.reload_interval
+        ):
+            self.reload(version)
+
+
+master_codes = MasterCodeRegistry(
+    reload_interval=getattr(settings, "MASTER_CODE_RELOAD_INTERVAL", 600),
+    cache_alias=getattr(settings, "USER_CONTEXT_CACHE_ALIAS", "default"),
+)
@@ -1,8 +1,9 @@
 from agent.models import (
     hrdatabase_employee,
     hrdatabase_teammanagement,
-    hrdatabase_hrmastercode,
 )
+from agent.services.identity_service import identity_cache
+from agent.services.master_code_service import master_codes
 
 
 def get_user_role(slack_id: str) -> dict:
@@ -16,28 +17,35 @@ def get_user_role(slack_id: str) -> dict:
 
     찾지 못한 경우 빈 dict 반환
     """
-    try:
-        # 1. Slack ID로 직원 정보 조회
-        employee = hrdatabase_employee.objects.get(slack_id=slack_id)
-    except hrdatabase_employee.DoesNotExist:
+    # 1. Slack ID -> employee_id 는 identity 캐시에서 (DB 조회 없음)
+    employee_id = identity_cache.employee_id_for_slack_id(slack_id)
+    if employee_id is None:
         return {}
 
-    # 2. rank_code -> 직급명 매핑
-    rank_code = employee.employee_level
-    rank_name = None
-    if rank_code:
-        try:
-            rank_entry = hrdatabase_hrmastercode.objects.get(code=rank_code)
-            rank_name = rank_entry.code_name
-        except hrdatabase_hrmastercode.DoesNotExist:
-            rank_name = "알 수 없음(미등록 코드)"
+    # 2. 직원 + 팀 정보를 한 번의 쿼리로 (LEFT JOIN hrdatabase_teammanagement)
+    employee = (
+        hrdatabase_employee.objects
+        .select_related("hrdatabase_teammanagement")
+        .filter(employee_id=employee_id)
+        .first()
+    )
+    if employee is None:
+        identity_cache.invalidate()
+        return {}
 
-    # 3. TeamManagement에서 employee_id로 팀 정보 조회
     try:
-        tm = hrdatabase_teammanagement.objects.get(employee_id=employee)
+        tm = employee.hrdatabase_teammanagement
     except hrdatabase_teammanagement.DoesNotExist:
         tm = None
 
+    # 3. 코드 -> 명칭은 메모리의 공통 코드 사전에서
+    codes = master_codes.snapshot()
+
+    rank_code = employee.employee_level
+    rank_name = None
+    if rank_code:
+        rank_name = codes.get(rank_code, "알 수 없음(미등록 코드)")
+
     team_name = None
     department_name = None
     team_leader = False
@@ -46,19 +54,11 @@ def get_user_role(slack_id: str) -> dict:
         team_leader = tm.team_leader
         # team_id -> 팀명
         if tm.team_id:
-            try:
-                team_code = hrdatabase_hrmastercode.objects.get(code=tm.team_id)
-                team_name = team_code.code_name
-            except hrdatabase_hrmastercode.DoesNotExist:
-                team_name = "알 수 없음(미등록 팀 코드)"
+            team_name = codes.get(tm.team_id, "알 수 없음(미등록 팀 코드)")
 
         # department -> 부서명
         if tm.department:
-            try:
-                dept_code = hrdatabase_hrmastercode.objects.get(code=tm.department)
-                department_name = dept_code.code_name
-            except hrdatabase_hrmastercode.DoesNotExist:
-                department_name = "알 수 없음(미등록 부서 코드)"
+            department_name = codes.get(tm.department, "알 수 없음(미등록 부서 코드)")
 
     return {
         "name": employee.employee_name,  # hrdatabase_employee.employee_name
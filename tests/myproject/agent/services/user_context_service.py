@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+
+from agent.services.role_service import get_access_level, get_user_role
+from agent.utils.cache_generation import bump_generation, get_generation
+
+
+# 대시보드(mega) login_check 의 사용자 정보 캐시 세대 번호 키.
+# mega/dashboard/services/cache_service.py 의 _generation_key(EMPLOYEES, ALL_MONTHS) 와 같아야 한다.
+DASHBOARD_USER_CONTEXT_GENERATION_KEY = "dashboard:gen:employees:all"
+
+
+@dataclass(frozen=True)
+class UserContext:
+    slack_id: str
+    role_info: dict  # get_user_role() 결과
+    access_level: str  # get_access_level() 결과
+
+
+class UserContextCache:
+    """
+    slack_id -> UserContext 캐시 (Django 캐시 백엔드 사용).
+    직급/팀은 거의 바뀌지 않으므로 메시지마다 역할·권한을 다시 계산하지 않고,
+    직원/팀/공통 코드가 바뀌면 invalidate() 로 세대 번호를 올려 무효화한다.
+
+    무효화는 import_csv_data·admin 등 다른 프로세스에서 일어나므로, run_socket_mode 까지
+    전달되려면 CACHES 에 Redis/Memcached 같은 공유 백엔드가 설정되어 있어야 한다.
+    (LocMem 이면 ttl 이 지나야 반영된다)
+    """
+
+    def __init__(self, ttl=600, cache_alias="default", prefix="agent:user_context"):
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+        self.prefix = prefix
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _generation_key(self):
+        return f"{self.prefix}:gen"
+
+    def _key(self, slack_id):
+        generation = get_generation(self._generation_key(), self.cache_alias)
+        return f"{self.prefix}:{generation}:{slack_id}"
+
+    def get(self, slack_id):
+        key = self._key(slack_id)
+        context = self.cache.get(key)
+        if context is not None:
+            return context
+
+        role_info = get_user_role(slack_id)
+        if not role_info:
+            return None
+        context = UserContext(
+            slack_id=slack_id,
+            role_info=role_info,
+            access_level=get_access_level(role_info),
+        )
+        self.cache.set(key, context, self.ttl)
+        return context
+
+    def invalidate(self, slack_id=None):
+        """slack_id 를 주면 해당 사용자만, 아니면 전체를 무효화한다."""
+        if slack_id is not None:
+            self.cache.delete(self._key(slack_id))
+            return
+        bump_generation(self._generation_key(), self.cache_alias)
+
+
+user_contexts = UserContextCache(
+    ttl=getattr(settings, "USER_CONTEXT_TTL", 600),
+    cache_alias=getattr(settings, "USER_CONTEXT_CACHE_ALIAS", "default"),
+)
+
+
+def get_user_context(slack_id):
+    """Slack 사용자의 UserContext, 등록되지 않은 사용자면 None"""
+    return user_contexts.get(slack_id)
+
+
+def invalidate_user_context(slack_id=None):
+    """
+    slack_id 를 주면 해당 사용자만 무효화한다. 전체 무효화(직원/팀/공통 코드 변경)면
+    같은 캐시 백엔드를 쓰는 대시보드의 로그인 사용자 정보 캐시도 함께 무효화한다.
+    """
+    user_contexts.invalidate(slack_id)
+    if slack_id is None:
+        bump_generation(DASHBOARD_USER_CONTEXT_GENERATION_KEY, user_contexts.cache_alias)
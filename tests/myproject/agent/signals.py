@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from agent.models import (
+    hrdatabase_employee,
+    hrdatabase_hrmastercode,
+    hrdatabase_teammanagement,
+)
+from agent.services.identity_service import identity_cache
+from agent.services.master_code_service import master_codes
+from agent.services.user_context_service import invalidate_user_context
+
+
+@receiver(post_save, sender=hrdatabase_employee)
+@receiver(post_delete, sender=hrdatabase_employee)
+@receiver(post_save, sender=hrdatabase_teammanagement)
+@receiver(post_delete, sender=hrdatabase_teammanagement)
+def employee_changed(sender, **kwargs):
+    # 관리자 화면 등에서 직원/팀이 바뀌면 identity 매핑과 역할 캐시를 비운다
+    identity_cache.invalidate()
+    invalidate_user_context()
+
+
+@receiver(post_save, sender=hrdatabase_hrmastercode)
+@receiver(post_delete, sender=hrdatabase_hrmastercode)
+def master_code_changed(sender, **kwargs):
+    master_codes.invalidate()
+    invalidate_user_context()
@@ -0,0 +1,20 @@
+from django.core.cache import caches
+
+
+def get_generation(key, cache_alias="default"):
+    """공유 캐시에 저장된 세대 번호 (없으면 0)"""
+    return caches[cache_alias].get(key, 0)
+
+
+def bump_generation(key, cache_alias="default"):
+    """
+    세대 번호를 1 올린다. 이 번호를 키에 넣거나 로드 시점 값과 비교하는 캐시는
+    다른 프로세스(import_csv_data, admin 등)에서 올려도 다음 조회 때 무효화된다.
+    """
+    cache = caches[cache_alias]
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # add 와 incr 사이에 키가 축출된 경우
+        cache.set(key, 1, None)
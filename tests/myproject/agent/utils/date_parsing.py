@@ -0,0 +1,49 @@
+import zoneinfo
+from datetime import date, datetime
+from functools import lru_cache
+
+SEOUL_TZ = zoneinfo.ZoneInfo("Asia/Seoul")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """'YYYY-MM-DD' -> date (빈 값/잘못된 형식은 None)"""
+    if not value:
+        return None
+    try:
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
+            return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def parse_datetime(value):
+    """'YYYY-MM-DD HH:MM:SS' -> Asia/Seoul 기준 aware datetime (빈 값/잘못된 형식은 None)"""
+    # 초 단위 값은 거의 겹치지 않으므로 캐시하지 않고, 반복되는 날짜 부분만 parse_date 캐시를 탄다
+    if not value:
+        return None
+    try:
+        if len(value) == 19 and value[10] == " " and value[13] == ":" and value[16] == ":":
+            day = parse_date(value[:10])
+            if day is None:
+                return None
+            return datetime(
+                day.year, day.month, day.day,
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                tzinfo=SEOUL_TZ,
+            )
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(tzinfo=SEOUL_TZ)
+    except ValueError:
+        return None
+
+
+def parse_columns(rows, date_columns=(), datetime_columns=()):
+    """CSV 행 묶음의 날짜/일시 컬럼을 컬럼 단위로 한 번에 변환 (rows 를 직접 수정)"""
+    for column in date_columns:
+        for row in rows:
+            row[column] = parse_date(row[column])
+    for column in datetime_columns:
+        for row in rows:
+            row[column] = parse_datetime(row[column])
+    return rows
@@ -0,0 +1,51 @@
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.db import close_old_connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("agent")
+
+_local = threading.local()
+_lock = threading.Lock()
+_totals = {"tasks": 0, "connections_opened": 0}
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _local.opened = getattr(_local, "opened", 0) + 1
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="agent_connection_metrics")
+
+
+def get_connection_metrics():
+    """프로세스 누적 {'tasks', 'connections_opened'}"""
+    with _lock:
+        return dict(_totals)
+
+
+@contextmanager
+def db_task(name):
+    """
+    요청/응답 사이클 밖(Socket Mode 이벤트 처리 등)에서 DB 를 쓰는 작업을 감싼다.
+
+    Django 는 요청 시작·종료 시점에만 CONN_MAX_AGE 만료와 상태 확인을 처리하므로,
+    오래 떠 있는 프로세스에서는 작업 전후로 close_old_connections() 를 직접 호출해야
+    MySQL wait_timeout 으로 끊긴 연결을 재사용하지 않는다.
+    """
+    close_old_connections()
+    _local.opened = 0
+    try:
+        yield
+    finally:
+        close_old_connections()
+        opened = _local.opened
+        with _lock:
+            _totals["tasks"] += 1
+            _totals["connections_opened"] += opened
+            totals = dict(_totals)
+        logger.debug(
+            f"[db] {name} opened {opened} connection(s) "
+            f"(total {totals['connections_opened']} for {totals['tasks']} task(s))"
+        )
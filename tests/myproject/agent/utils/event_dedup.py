@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Slack 은 응답이 늦으면 같은 이벤트를 수 분에 걸쳐 재전송하므로 그 이상 기억한다
+DEFAULT_TTL = 15 * 60
+DEFAULT_MAX_SIZE = 10000
+
+
+class EventDeduplicator:
+    """
+    프로세스 메모리 기반 이벤트 중복 제거기.
+    TTL 이 지난 event_id 는 버리고, 최대 max_size 개까지만 기억한다. (조회/추가 O(1))
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._seen = OrderedDict()  # event_id -> 만료 시각 (삽입 순 = 만료 순)
+        self._lock = threading.Lock()
+
+    def first_seen(self, event_id):
+        """처음 보는 event_id 면 기록하고 True, 이미 처리한 것이면 False"""
+        now = time.monotonic()
+        with self._lock:
+            while self._seen:
+                oldest_id, expires_at = next(iter(self._seen.items()))
+                if expires_at > now:
+                    break
+                del self._seen[oldest_id]
+
+            if event_id in self._seen:
+                return False
+            self._seen[event_id] = now + self.ttl
+            while len(self._seen) > self.max_size:
+                self._seen.popitem(last=False)
+            return True
+
+    def __len__(self):
+        return len(self._seen)
+
+
+class CacheEventDeduplicator:
+    """
+    Django 캐시 백엔드 기반 중복 제거기.
+    Redis/Memcached 같은 공유 백엔드를 쓰면 여러 Socket Mode 프로세스와 재시작 사이에서
+    중복 제거 상태가 유지된다. cache.add 는 키가 없을 때만 저장하므로 원자적으로 판정된다.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, cache_alias="default", prefix="slack:event:"):
+        self.ttl = ttl
+        self.cache = caches[cache_alias]
+        self.prefix = prefix
+
+    def first_seen(self, event_id):
+        return self.cache.add(f"{self.prefix}{event_id}", 1, self.ttl)
+
+
+def build_event_deduplicator():
+    """settings.SLACK_DEDUP_* 설정에 맞는 중복 제거기를 만든다."""
+    ttl = getattr(settings, "SLACK_DEDUP_TTL", DEFAULT_TTL)
+    if getattr(settings, "SLACK_DEDUP_BACKEND", "memory") == "cache":
+        return CacheEventDeduplicator(
+            ttl=ttl, cache_alias=getattr(settings, "SLACK_DEDUP_CACHE_ALIAS", "default")
+        )
+    return EventDeduplicator(
+        ttl=ttl, max_size=getattr(settings, "SLACK_DEDUP_MAX_SIZE", DEFAULT_MAX_SIZE)
+    )
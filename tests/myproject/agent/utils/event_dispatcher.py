@@ -0,0 +1,126 @@
+import logging
+import queue
+import threading
+import time
+import zlib
+
+logger = logging.getLogger("agent")
+
+
+class EventDispatcher:
+    """
+    Slack 이벤트 처리를 고정 크기 워커 스레드 풀로 넘기는 디스패처.
+
+    - 같은 key(사용자 ID)는 항상 같은 워커 큐로 가므로 사용자별 처리 순서가 보장된다.
+    - 워커별 큐는 크기가 제한되어 있어, 가득 차면 put_timeout 만큼 기다린 뒤 거절한다.
+    - stats() 로 큐 길이, 대기/처리 시간 등의 지표를 확인할 수 있다.
+    """
+
+    def __init__(self, workers=4, queue_size=50, put_timeout=0.5, name="slack-worker"):
+        self.put_timeout = put_timeout
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._lock = threading.Lock()
+        self._closing = False
+        self._stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+            "run_seconds_total": 0.0,
+            "run_seconds_max": 0.0,
+        }
+        self._threads = [
+            threading.Thread(target=self._run, args=(q,), name=f"{name}-{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key, func, *args, **kwargs):
+        """작업을 key 에 해당하는 워커 큐에 넣는다. 큐가 가득 찼거나 종료 중이면 False."""
+        if self._closing:
+            return False
+        target = self._queues[zlib.crc32(str(key).encode("utf-8")) % len(self._queues)]
+        try:
+            target.put((time.monotonic(), func, args, kwargs), timeout=self.put_timeout)
+        except queue.Full:
+            with self._lock:
+                self._stats["rejected"] += 1
+            logger.warning(f"[dispatcher] queue full, rejected work for key={key}")
+            return False
+        with self._lock:
+            self._stats["submitted"] += 1
+        return True
+
+    def _run(self, work_queue):
+        while True:
+            item = work_queue.get()
+            if item is None:
+                work_queue.task_done()
+                return
+            enqueued_at, func, args, kwargs = item
+            started_at = time.monotonic()
+            failed = False
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                failed = True
+                logger.exception("[dispatcher] work item failed")
+            finally:
+                finished_at = time.monotonic()
+                self._record(started_at - enqueued_at, finished_at - started_at, failed)
+                work_queue.task_done()
+
+    def _record(self, waited, ran, failed):
+        with self._lock:
+            self._stats["failed" if failed else "completed"] += 1
+            self._stats["wait_seconds_total"] += waited
+            self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], waited)
+            self._stats["run_seconds_total"] += ran
+            self._stats["run_seconds_max"] = max(self._stats["run_seconds_max"], ran)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        done = stats["completed"] + stats["failed"]
+        stats["queue_depth"] = [q.qsize() for q in self._queues]
+        stats["wait_seconds_avg"] = stats["wait_seconds_total"] / done if done else 0.0
+        stats["run_seconds_avg"] = stats["run_seconds_total"] / done if done else 0.0
+        return stats
+
+    def shutdown(self, wait=True, timeout=10.0):
+        """
+        새 작업을 받지 않고 워커에 종료 신호를 보낸다.
+        timeout 안에 종료 신호를 넣지 못할 만큼 큐가 밀려 있으면 남은 작업을 버리고 신호를 넣으며,
+        wait=True 여도 워커를 최대 timeout 까지만 기다린다 (워커는 daemon 스레드).
+        """
+        self._closing = True
+        deadline = time.monotonic() + timeout
+        for work_queue in self._queues:
+            try:
+                work_queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                dropped = self._drain(work_queue)
+                logger.warning(f"[dispatcher] shutdown timed out, dropped {dropped} queued work item(s)")
+                work_queue.put_nowait(None)
+        if wait:
+            for thread in self._threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+                if thread.is_alive():
+                    logger.warning(f"[dispatcher] {thread.name} did not stop within {timeout}s")
+
+    def _drain(self, work_queue):
+        dropped = 0
+        while True:
+            try:
+                work_queue.get_nowait()
+            except queue.Empty:
+                break
+            work_queue.task_done()
+            dropped += 1
+        with self._lock:
+            self._stats["dropped"] += dropped
+        return dropped
@@ -0,0 +1,112 @@
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from slack_sdk.errors import SlackApiError
+
+logger = logging.getLogger("agent")
+
+SLACK_API_URL = "https://slack.com/api/"
+
+
+class SlackTransport:
+    """
+    Slack Web API 호출을 위한 공용 전송 계층.
+
+    - requests.Session + HTTPAdapter 로 slack.com 연결을 keep-alive 풀에서 재사용한다.
+    - HTTP 429 를 받으면 Retry-After 만큼 해당 API 메서드 호출을 멈췄다가 재시도한다.
+    실패 시(연결 오류/타임아웃 포함) slack_sdk 와 동일하게 SlackApiError 를 던지므로
+    e.response['error'] 로 원인을 본다.
+    """
+
+    def __init__(self, token, pool_size=20, max_retries=3, timeout=10):
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Content-type": "application/json; charset=utf-8",
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._blocked_until = {}  # API 메서드 -> rate limit 해제 시각
+
+    def api_call(self, method, http_method="POST", params=None, json=None):
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit(method)
+            try:
+                response = self.session.request(
+                    http_method, SLACK_API_URL + method, params=params, json=json, timeout=self.timeout
+                )
+            except requests.RequestException as exc:
+                # 호출부는 SlackApiError 만 잡으므로 네트워크 오류도 같은 형태로 변환
+                raise SlackApiError(
+                    f"Request failed while calling {method}: {exc}",
+                    {"ok": False, "error": type(exc).__name__},
+                ) from exc
+            if response.status_code == 429 and attempt < self.max_retries:
+                retry_after = int(response.headers.get("Retry-After", "1"))
+                logger.warning(f"[slack] {method} rate limited, retry after {retry_after}s")
+                with self._lock:
+                    self._blocked_until[method] = time.monotonic() + retry_after
+                continue
+            if response.status_code != 200:
+                raise SlackApiError(
+                    f"HTTP Error while calling {method}: {response.status_code}",
+                    {"ok": False, "error": f"http_{response.status_code}"},
+                )
+            try:
+                data = response.json()
+            except ValueError as exc:
+                raise SlackApiError(
+                    f"Invalid JSON response while calling {method}",
+                    {"ok": False, "error": "invalid_json"},
+                ) from exc
+            if not data.get("ok"):
+                raise SlackApiError(f"Error calling {method}: {data.get('error')}", data)
+            return data
+
+    def _wait_for_rate_limit(self, method):
+        with self._lock:
+            blocked_until = self._blocked_until.get(method, 0)
+        delay = blocked_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    # -----------------------
+    # 자주 쓰는 메서드
+    # -----------------------
+    def post_message(self, channel, text, thread_ts=None):
+        payload = {"channel": channel, "text": text}
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+        return self.api_call("chat.postMessage", json=payload)
+
+    def post_ephemeral(self, channel, user, text):
+        return self.api_call("chat.postEphemeral", json={"channel": channel, "user": user, "text": text})
+
+    def update_message(self, channel, ts, text):
+        return self.api_call("chat.update", json={"channel": channel, "ts": ts, "text": text})
+
+    def lookup_user_by_email(self, email):
+        return self.api_call("users.lookupByEmail", http_method="GET", params={"email": email})
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_slack_transport():
+    """settings.SLACK_BOT_TOKEN 으로 만든 프로세스 공용 SlackTransport"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = SlackTransport(
+                settings.SLACK_BOT_TOKEN,
+                pool_size=getattr(settings, "SLACK_HTTP_POOL_SIZE", 20),
+            )
+        return _transport
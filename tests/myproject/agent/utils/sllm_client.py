@@ -1,10 +1,16 @@
 import requests
+from django.conf import settings
 
 
 def query_sllm(prompt: str, num_return_sequences=1):
+    # 상주 RAG 서비스(tests/sy/text_generation/server.py)의 생성 엔드포인트 호출
     payload = {"prompt": prompt, "num_return_sequences": num_return_sequences}
-    response = requests.post("http://localhost:8000/sllm/generate/", json=payload)
+    response = requests.post(
+        f"{settings.SLLM_BASE_URL.rstrip('/')}/sllm/generate/",
+        json=payload,
+        timeout=settings.SLLM_TIMEOUT,
+    )
+    response.raise_for_status()
     data = response.json()
-    if num_return_sequences > 1:
-        return data["text"]
+    # num_return_sequences > 1 이면 text 는 문자열 리스트
     return data["text"]
@@ -1,17 +1,18 @@
 from django.shortcuts import render
 
 # from agent.services.agent_service import process_user_message
-from agent.services.role_service import get_user_role, get_access_level
+from agent.services.user_context_service import get_user_context
 
 
 def handle_slack_event(user_message, user_id, channel_id):
     # user_id는 Slack 상의 유저 ID (slack_id)라 가정
-    user_info = get_user_role(user_id)  # DB에서 사용자 정보 조회
+    user_context = get_user_context(user_id)  # 캐시된 역할/권한 (없으면 DB에서 조회)
 
-    if not user_info:
+    if not user_context:
         return "해당 Slack 사용자를 찾을 수 없습니다."
 
-    access_level = get_access_level(user_info)
+    user_info = user_context.role_info
+    access_level = user_context.access_level
     # 사용자 정보를 문자열 형태로 정리
     response_text = (
         f"사용자 정보:\n"
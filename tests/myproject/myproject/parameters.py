@@ -0,0 +1,183 @@
+"""
+AWS Parameter Store 설정값 로더
+
+settings.py 가 import 될 때마다(gunicorn 워커, manage.py 실행마다) 파라미터를 하나씩
+get_parameter 로 가져오던 것을, 필요한 이름을 GetParameters 로 묶어 한 번에 가져오고
+프로세스 동안 재사용한다. 환경 변수로 동작을 바꿀 수 있다.
+
+- MEGA_PARAMETER_SOURCE: ssm(기본) | env | file
+    env  : '/mega/slack/SLACK_APP_TOKEN' -> 환경 변수 MEGA_SLACK_SLACK_APP_TOKEN
+    file : MEGA_PARAMETER_FILE 의 JSON({"/mega/SECRET_KEY": "...", ...})
+- MEGA_PARAMETER_SNAPSHOT_KEY: Fernet 키. 지정하면 SSM 결과를 암호화해 디스크에 저장
+- MEGA_PARAMETER_SNAPSHOT_TTL: 스냅샷 유효 시간(초, 기본 3600)
+- MEGA_PARAMETER_SNAPSHOT_PATH: 스냅샷 파일 경로
+
+대시보드(mega)와 Slack 에이전트(tests/myproject) 설정이 같이 사용한다. 두 프로젝트는
+따로 배포되므로 에이전트 쪽에는 같은 내용의 사본(tests/myproject/myproject/parameters.py)을
+두고, 이 파일이 원본이다. 수정한 뒤 `make sync-parameters` 로 사본을 갱신한다.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # 스냅샷 기능만 비활성화 (키가 지정되어 있으면 경고)
+    Fernet = None
+    InvalidToken = Exception
+
+logger = logging.getLogger(__name__)
+
+# GetParameters 한 번에 요청할 수 있는 최대 이름 수
+SSM_BATCH_SIZE = 10
+
+
+def env_var_name(name):
+    """'/mega/slack/SLACK_APP_TOKEN' -> 'MEGA_SLACK_SLACK_APP_TOKEN'"""
+    return name.strip('/').replace('/', '_').replace('-', '_').upper()
+
+
+class ParameterStore:
+    def __init__(self, names, source='ssm', region_name='ap-northeast-2', local_file=None,
+                 snapshot_path=None, snapshot_key=None, snapshot_ttl=3600):
+        self.names = list(dict.fromkeys(names))
+        self.source = source
+        self.region_name = region_name
+        self.local_file = local_file
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.snapshot_key = snapshot_key
+        self.snapshot_ttl = snapshot_ttl
+        self._values = None
+        self._raw_values = {}  # with_decryption=False 로 가져온 SecureString 원문
+        self._client = None
+        if snapshot_key and Fernet is None:
+            logger.warning(
+                "MEGA_PARAMETER_SNAPSHOT_KEY 가 지정되었지만 cryptography 패키지가 없어 "
+                "파라미터 스냅샷을 사용하지 않습니다."
+            )
+
+    @classmethod
+    def from_env(cls, names, base_dir):
+        return cls(
+            names,
+            source=os.getenv('MEGA_PARAMETER_SOURCE', 'ssm'),
+            local_file=os.getenv('MEGA_PARAMETER_FILE'),
+            snapshot_path=os.getenv('MEGA_PARAMETER_SNAPSHOT_PATH', os.path.join(base_dir, '.parameter_snapshot')),
+            snapshot_key=os.getenv('MEGA_PARAMETER_SNAPSHOT_KEY'),
+            snapshot_ttl=int(os.getenv('MEGA_PARAMETER_SNAPSHOT_TTL', '3600')),
+        )
+
+    def get(self, name, with_decryption=True):
+        if not with_decryption and self.source == 'ssm':
+            # 복호화하지 않은 값은 스냅샷/일괄 조회와 따로 가져와 캐시
+            if name not in self._raw_values:
+                self._raw_values.update(self._fetch_ssm([name], with_decryption=False))
+            return self._raw_values[name]
+        if self._values is None:
+            self._values = self._load()
+        if name not in self._values:
+            # 미리 선언하지 않은 이름은 개별로 가져와 캐시
+            self._values.update(self._fetch([name]))
+        return self._values[name]
+
+    def _load(self):
+        if self.source == 'env':
+            return self._from_env(self.names)
+        if self.source == 'file':
+            return self._from_file()
+        if self.source != 'ssm':
+            raise ImproperlyConfigured(f"알 수 없는 MEGA_PARAMETER_SOURCE: {self.source}")
+
+        values = self._read_snapshot()
+        if values is not None and all(name in values for name in self.names):
+            return values
+        values = self._fetch_ssm(self.names)
+        self._write_snapshot(values)
+        return values
+
+    def _fetch(self, names):
+        if self.source == 'env':
+            return self._from_env(names)
+        if self.source == 'file':
+            missing = [name for name in names if name not in self._values]
+            raise ImproperlyConfigured(f"파라미터 파일에 값이 없습니다: {missing}")
+        return self._fetch_ssm(names)
+
+    # -----------------------
+    # 원천별 조회
+    # -----------------------
+    def _fetch_ssm(self, names, with_decryption=True):
+        if self._client is None:
+            import boto3
+            self._client = boto3.client('ssm', region_name=self.region_name)
+
+        values = {}
+        invalid = []
+        for i in range(0, len(names), SSM_BATCH_SIZE):
+            response = self._client.get_parameters(
+                Names=names[i:i + SSM_BATCH_SIZE], WithDecryption=with_decryption
+            )
+            for parameter in response['Parameters']:
+                values[parameter['Name']] = parameter['Value']
+            invalid.extend(response.get('InvalidParameters', []))
+        if invalid:
+            raise ImproperlyConfigured(f"Parameter Store 에 없는 파라미터: {invalid}")
+        return values
+
+    def _from_env(self, names):
+        missing = [name for name in names if env_var_name(name) not in os.environ]
+        if missing:
+            raise ImproperlyConfigured(
+                "환경 변수가 없습니다: " + ", ".join(env_var_name(name) for name in missing)
+            )
+        return {name: os.environ[env_var_name(name)] for name in names}
+
+    def _from_file(self):
+        if not self.local_file:
+            raise ImproperlyConfigured("MEGA_PARAMETER_SOURCE=file 에는 MEGA_PARAMETER_FILE 이 필요합니다.")
+        with open(self.local_file, 'r', encoding='utf-8') as f:
+            return {name: str(value) for name, value in json.load(f).items()}
+
+    # -----------------------
+    # 암호화 스냅샷
+    # -----------------------
+    def _snapshot_enabled(self):
+        return bool(Fernet and self.snapshot_key and self.snapshot_path and self.snapshot_ttl > 0)
+
+    def _read_snapshot(self):
+        if not self._snapshot_enabled():
+            return None
+        try:
+            if time.time() - self.snapshot_path.stat().st_mtime > self.snapshot_ttl:
+                return None
+            token = self.snapshot_path.read_bytes()
+            return json.loads(Fernet(self.snapshot_key).decrypt(token, ttl=self.snapshot_ttl))
+        except (OSError, ValueError, InvalidToken):
+            # 손상되었거나 키가 바뀐 스냅샷은 무시하고 SSM 에서 다시 가져온다
+            return None
+
+    def _write_snapshot(self, values):
+        if not self._snapshot_enabled():
+            return
+        token = Fernet(self.snapshot_key).encrypt(json.dumps(values).encode('utf-8'))
+        tmp_path = None
+        try:
+            # 여러 워커가 동시에 써도 깨지지 않도록 임시 파일에 쓴 뒤 교체
+            fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_path.parent, prefix='.parameter_snapshot.')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(token)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            # 스냅샷은 캐시일 뿐이므로 실패해도 진행하되, 남은 임시 파일은 지움
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
@@ -12,14 +12,28 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 import os
-import boto3
 
-# AWS SSM 클라이언트 생성
-ssm = boto3.client('ssm', region_name='ap-northeast-2')
+# mega/config/parameters.py 의 사본 (원본을 고친 뒤 `make sync-parameters`)
+from myproject.parameters import ParameterStore
+
+# AWS Parameter Store 값은 GetParameters 로 묶어서 한 번에 가져온다
+parameters = ParameterStore.from_env([
+    '/mega/SECRET_KEY',
+    '/mega/slack/SLACK_APP_TOKEN',
+    '/mega/slack/SLACK_BOT_TOKEN',
+    '/mega/OPENAI_API_KEY',
+    '/mega/calendar/googleCalendarApiKey',
+    '/mega/calendar/googleCalendarId',
+    '/mega/oh-db-info/DB_NAME',
+    '/mega/oh-db-info/DB_USER',
+    '/mega/oh-db-info/DB_PASSWORD',
+    '/mega/oh-db-info/DB_HOST',
+    '/mega/oh-db-info/DB_PORT',
+], Path(__file__).resolve().parent.parent)
 
 def get_parameter(name, with_decryption=True):
-    """AWS Parameter Store에서 값을 가져오는 함수"""
-    return ssm.get_parameter(Name=name, WithDecryption=with_decryption)['Parameter']['Value']
+    """AWS Parameter Store에서 값을 가져오는 함수 (프로세스 내 캐시 사용)"""
+    return parameters.get(name, with_decryption=with_decryption)
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = get_parameter('/mega/SECRET_KEY')
@@ -98,10 +112,45 @@ DATABASES = {
         'PASSWORD': get_parameter('/mega/oh-db-info/DB_PASSWORD'),#, with_decryption=True),
         'HOST': get_parameter('/mega/oh-db-info/DB_HOST'),
         'PORT': get_parameter('/mega/oh-db-info/DB_PORT'),
+        # 요청마다 RDS 에 새로 접속(TLS + 인증)하지 않도록 연결을 재사용한다.
+        # MySQL wait_timeout 보다 짧게 두고, 재사용 전 상태 확인으로 끊긴 연결을 걸러낸다.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
     }
 }
 
 
+# Cache
+# 기본은 프로세스 로컬 메모리 캐시. Socket Mode 프로세스 여러 개가 상태를 공유하거나
+# import_csv_data·admin 에서의 사용자 정보 무효화를 run_socket_mode 에 바로 반영하려면
+# DJANGO_CACHE_BACKEND/DJANGO_CACHE_LOCATION 으로 Redis·Memcached 등 공유 백엔드를 지정한다.
+# 대시보드(mega)와 같은 백엔드/LOCATION 을 쓰면 import_csv_data 가 대시보드의 로그인 사용자
+# 정보 캐시도 무효화한다.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "mega-agent"),
+    }
+}
+
+# Slack 사용자 역할/권한(UserContext) 캐시 TTL (초)
+USER_CONTEXT_TTL = int(os.getenv("USER_CONTEXT_TTL", "600"))
+
+# Slack 이벤트 중복 제거 (memory: 프로세스 로컬, cache: 위 CACHES 백엔드 공유)
+SLACK_DEDUP_BACKEND = os.getenv("SLACK_DEDUP_BACKEND", "memory")
+SLACK_DEDUP_TTL = int(os.getenv("SLACK_DEDUP_TTL", "900"))
+SLACK_DEDUP_MAX_SIZE = int(os.getenv("SLACK_DEDUP_MAX_SIZE", "10000"))
+
+# Slack Socket Mode 이벤트 워커 풀
+SLACK_WORKER_CONCURRENCY = int(os.getenv("SLACK_WORKER_CONCURRENCY", "4"))
+SLACK_WORKER_QUEUE_SIZE = int(os.getenv("SLACK_WORKER_QUEUE_SIZE", "50"))
+
+# 상주 RAG/sLLM 서비스 (tests/sy/text_generation/server.py)
+SLLM_BASE_URL = os.getenv("SLLM_BASE_URL", "http://localhost:8001")
+SLLM_TIMEOUT = int(os.getenv("SLLM_TIMEOUT", "120"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,43 @@
+# benchmark_embedding.py
+# QA 데이터셋 임베딩 속도 비교: 문장마다 encode() 호출 vs 배치 임베딩
+# 사용 예: python benchmark_embedding.py --limit 500 --batch-size 64
+
+import argparse
+import time
+
+import numpy as np
+
+from modules.config import EMBEDDING_BATCH_SIZE, QA_DATASET_PATH
+from modules.data_loader import load_qa_dataset
+from modules.faiss_indexer import FaissIndexer
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dataset", default=QA_DATASET_PATH)
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 사용할 QA 개수")
+    parser.add_argument("--batch-size", type=int, default=EMBEDDING_BATCH_SIZE)
+    args = parser.parse_args()
+
+    qa_dataset = load_qa_dataset(args.dataset)[:args.limit]
+    texts = [item["instruction"] for item in qa_dataset]
+    indexer = FaissIndexer(qa_dataset)
+    indexer.get_embedding(texts[0])  # 모델 warm-up
+
+    started = time.perf_counter()
+    per_item = np.array([indexer.get_embedding(text) for text in texts], dtype="float32")
+    per_item_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batched = indexer.embed_texts(texts, batch_size=args.batch_size)
+    batched_sec = time.perf_counter() - started
+
+    max_diff = float(np.abs(per_item - batched).max())
+    print(f"{len(texts)} docs")
+    print(f"per-item loop : {per_item_sec:7.2f}s ({len(texts) / per_item_sec:7.1f} docs/s)")
+    print(f"batched ({args.batch_size:>3}) : {batched_sec:7.2f}s ({len(texts) / batched_sec:7.1f} docs/s)")
+    print(f"speedup x{per_item_sec / batched_sec:.1f}, max abs diff {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,15 +27,16 @@ def main(user_queries, user_token="dummy_token"):
     # 1) QA 데이터 로드
     qa_dataset = load_qa_dataset()
 
-    # 2) Faiss 인덱스 생성
+    # 2) Faiss 인덱스 로드 (데이터셋/임베딩 모델이 바뀐 경우에만 새로 생성)
     indexer = FaissIndexer(qa_dataset)
-    indexer.build_index()
+    indexer.load_or_build_index()
 
     # 3) 파인튜닝된 모델 로드
     qa_model = QAModel()
 
-    # 사용자 입력 목록 처리
-    results = []
+    # 사용자 입력 목록 전처리
+    processed_inputs = []
+    search_queries = []
     for user_input in user_queries:
         # 1) 프롬프트 인젝션 방지
         user_input_processed = prevent_prompt_injection(user_input)
@@ -43,20 +44,21 @@ def main(user_queries, user_token="dummy_token"):
         # 2) 개인정보 제거
         user_input_processed = sanitize_user_input(user_input_processed)
 
-        # 3) 키워드 추출 후 임베딩
+        # 3) 키워드 추출
         keywords = extract_keywords(user_input_processed, top_n=4)
-        search_query = " ".join(keywords) if keywords else user_input_processed
-        query_emb = indexer.get_embedding(search_query)
+        processed_inputs.append(user_input_processed)
+        search_queries.append(" ".join(keywords) if keywords else user_input_processed)
 
-        # 4) 접근 권한 체크
-        if not has_access(user_token):
-            # 권한이 없을 경우 특정 문구 리턴
-            results.append("벡터DB 접근 불가")
-            continue
+    # 4) 접근 권한 체크
+    if not has_access(user_token):
+        # 권한이 없을 경우 특정 문구 리턴
+        return ["벡터DB 접근 불가"] * len(user_queries)
 
-        # 5) 검색
-        top_indices, all_sims = indexer.search(query_emb)
+    # 5) 모든 질문을 한 번에 임베딩 후 검색
+    search_results = indexer.search_batch(search_queries)
 
+    results = []
+    for user_input_processed, (top_indices, top_scores) in zip(processed_inputs, search_results):
         # 해당 QA 쌍들
         if len(top_indices) == 0:
             # 관련 문서가 없는 경우
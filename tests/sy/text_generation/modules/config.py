@@ -1,7 +1,11 @@
 # modules/config.py
 
+import os
 import re
 
+# text_generation 폴더 경로
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # 환경 설정 상수들
 SIMILARITY_THRESHOLD = 0.63
 TOP_K = 4
@@ -11,12 +15,32 @@ PERSONAL_INFO_PATTERNS = [
 ]
 MODERATION_KEYWORDS = ["비속어", "폭력", "혐오"]
 AYA_EMBEDDING_MODEL = "sentence-transformers/xlm-r-base-en-ko-nli-ststb"  # 예시 한국어 Sentence-BERT
+EMBEDDING_BATCH_SIZE = 64  # 인덱스 생성 시 한 번에 임베딩할 문장 수
+
+# Faiss 인덱스 종류: "flat"(정확 검색), "ivf", "hnsw", "auto"(문서 수가 ANN_MIN_CORPUS_SIZE 이상이면 hnsw)
+FAISS_INDEX_TYPE = "auto"
+ANN_MIN_CORPUS_SIZE = 50000
+IVF_NLIST = 1024  # ivf 클러스터 수 (문서 수에 맞춰 줄어듦)
+IVF_NPROBE = 16  # ivf 검색 시 살펴볼 클러스터 수
+HNSW_M = 32
+HNSW_EF_SEARCH = 64
 
 # 파인 튜닝된 모델 폴더 경로
 FINE_TUNED_MODEL_PATH = "./models/finetuned_model_welfare_vacation_service_20241223_075828"
 
 # JSONL QA 데이터셋 경로
-QA_DATASET_PATH = "/Users/suyeon/dev/SKN_final_project/project_test/SKN03-FINAL-3Team/tests/sy/text_generation/data/train_welfare_vacation_service.jsonl"
+QA_DATASET_PATH = os.path.join(BASE_DIR, "data", "train_welfare_vacation_service.jsonl")
+
+# 임베딩 행렬(.npy)과 Faiss 인덱스 저장 폴더 (데이터셋/모델이 바뀌면 새로 생성)
+INDEX_CACHE_DIR = os.path.join(BASE_DIR, "index_cache")
+
+# 상주 RAG 서비스(server.py) 주소 (agent 의 SLLM_BASE_URL 과 맞춤, 8000 은 Django/gunicorn 이 사용)
+RAG_SERVER_HOST = "127.0.0.1"
+RAG_SERVER_PORT = 8001
+# 요청 하나가 서버를 오래 붙잡지 않도록 두는 상한
+RAG_MAX_TOP_K = 50
+RAG_MAX_QUERIES = 64
+RAG_MAX_RETURN_SEQUENCES = 4
 
 # 시스템 프롬프트
 SYSTEM_INSTRUCTIONS = (
@@ -4,9 +4,9 @@ import json
 import re
 from .config import QA_DATASET_PATH
 
-def load_qa_dataset():
+def load_qa_dataset(path=QA_DATASET_PATH):
     qa_dataset = []
-    with open(QA_DATASET_PATH, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8") as f:
         for line in f:
             item = json.loads(line.strip())
             instruction = item.get("instruction")
@@ -1,38 +1,158 @@
 # modules/faiss_indexer.py
 
+import hashlib
+import math
+import os
 import faiss
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from .config import AYA_EMBEDDING_MODEL, SIMILARITY_THRESHOLD, TOP_K
+from tqdm import tqdm
+from .config import (
+    ANN_MIN_CORPUS_SIZE,
+    AYA_EMBEDDING_MODEL,
+    EMBEDDING_BATCH_SIZE,
+    FAISS_INDEX_TYPE,
+    HNSW_EF_SEARCH,
+    HNSW_M,
+    INDEX_CACHE_DIR,
+    IVF_NLIST,
+    IVF_NPROBE,
+    SIMILARITY_THRESHOLD,
+    TOP_K,
+)
 from .preprocessor import sanitize_documents
 
 class FaissIndexer:
-    def __init__(self, qa_dataset):
+    def __init__(self, qa_dataset, embedding_model=None):
         self.qa_dataset = qa_dataset
-        self.embedding_model = SentenceTransformer(AYA_EMBEDDING_MODEL)
+        # embedding_model 을 넘기면 SentenceTransformer 대신 사용 (테스트용 stub 등)
+        if embedding_model is None:
+            self.embedding_model = SentenceTransformer(AYA_EMBEDDING_MODEL)
+            self.embedding_model_name = AYA_EMBEDDING_MODEL
+        else:
+            self.embedding_model = embedding_model
+            self.embedding_model_name = type(embedding_model).__name__
         self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
-        self.index = faiss.IndexFlatL2(self.embedding_dim)
+        self.index_type = self.resolve_index_type(len(qa_dataset))
+        self.index = None
         self.qa_embeddings = None
 
-    def build_index(self):
-        embeddings = []
-        for item in self.qa_dataset:
-            emb = self.get_embedding(item["instruction"])
-            embeddings.append(emb)
-        self.qa_embeddings = np.array(embeddings, dtype='float32')
+    @staticmethod
+    def resolve_index_type(corpus_size):
+        if FAISS_INDEX_TYPE == "auto":
+            return "hnsw" if corpus_size >= ANN_MIN_CORPUS_SIZE else "flat"
+        return FAISS_INDEX_TYPE
 
-        self.index.add(self.qa_embeddings)
+    def create_index(self, embeddings):
+        # 정규화된 벡터의 내적 = 코사인 유사도
+        if self.index_type == "flat":
+            index = faiss.IndexFlatIP(self.embedding_dim)
+        elif self.index_type == "ivf":
+            nlist = max(1, min(IVF_NLIST, int(math.sqrt(len(embeddings)))))
+            quantizer = faiss.IndexFlatIP(self.embedding_dim)
+            index = faiss.IndexIVFFlat(quantizer, self.embedding_dim, nlist, faiss.METRIC_INNER_PRODUCT)
+            index.train(embeddings)
+            index.nprobe = min(IVF_NPROBE, nlist)
+        elif self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.embedding_dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+        else:
+            raise ValueError(f"Unknown FAISS_INDEX_TYPE: {self.index_type}")
+        index.add(embeddings)
+        return index
+
+    def corpus_texts(self):
+        # 인덱스에 들어가는 문장 (로더 전처리가 끝난 instruction)
+        return [item["instruction"] for item in self.qa_dataset]
+
+    def build_index(self, batch_size=EMBEDDING_BATCH_SIZE, show_progress=True):
+        self.qa_embeddings = self.embed_texts(self.corpus_texts(), batch_size, show_progress)
+        faiss.normalize_L2(self.qa_embeddings)
+
+        self.index = self.create_index(self.qa_embeddings)
+
+    def cache_key(self):
+        # 실제로 임베딩하는 문장 + 임베딩 모델 이름 + 인덱스 종류가 같으면 같은 키
+        # (파일이 아니라 전처리 후 문장을 해시하므로 로더 전처리가 바뀌어도 다시 만든다)
+        digest = hashlib.md5()
+        for text in self.corpus_texts():
+            digest.update(text.encode("utf-8"))
+            digest.update(b"\x00")
+        digest.update(self.embedding_model_name.encode("utf-8"))
+        digest.update(f"normalized-ip:{self.index_type}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def load_or_build_index(self, cache_dir=INDEX_CACHE_DIR):
+        """
+        저장된 임베딩/인덱스가 있으면 불러오고, 없으면 새로 만들어 저장한다.
+        불러왔으면 True, 새로 만들었으면 False 를 반환한다.
+        """
+        key = self.cache_key()
+        index_path = os.path.join(cache_dir, f"{key}.faiss")
+        embeddings_path = os.path.join(cache_dir, f"{key}.npy")
+
+        if os.path.exists(index_path) and os.path.exists(embeddings_path):
+            # 임베딩은 mmap 으로 열어 필요한 부분만 메모리에 올림
+            qa_embeddings = np.load(embeddings_path, mmap_mode="r")
+            if len(qa_embeddings) == len(self.qa_dataset):
+                self.qa_embeddings = qa_embeddings
+                self.index = faiss.read_index(index_path)
+                return True
+
+        self.build_index()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_embeddings_path = f"{embeddings_path}.{os.getpid()}.tmp"
+        with open(tmp_embeddings_path, "wb") as f:
+            np.save(f, self.qa_embeddings)
+        os.replace(tmp_embeddings_path, embeddings_path)
+        tmp_index_path = f"{index_path}.{os.getpid()}.tmp"
+        faiss.write_index(self.index, tmp_index_path)
+        os.replace(tmp_index_path, index_path)
+        return False
+
+    def embed_texts(self, texts, batch_size=EMBEDDING_BATCH_SIZE, show_progress=False):
+        # 길이가 비슷한 문장끼리 묶어 패딩을 줄이고, 결과는 원래 순서대로 채움
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        embeddings = np.empty((len(texts), self.embedding_dim), dtype="float32")
+
+        batches = range(0, len(order), batch_size)
+        if show_progress:
+            batches = tqdm(batches, desc="Embedding", unit="batch")
+        for start in batches:
+            batch_indices = order[start:start + batch_size]
+            embeddings[batch_indices] = self.embedding_model.encode(
+                [texts[i] for i in batch_indices],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+            )
+        return embeddings
 
     def get_embedding(self, text):
         return self.embedding_model.encode([text])[0]
 
     def search(self, query_emb):
-        # 코사인 유사도 계산
-        all_sims = cosine_similarity([query_emb], self.qa_embeddings)[0]
-        # threshold 이상인 인덱스
-        filtered_indices = np.where(all_sims >= SIMILARITY_THRESHOLD)[0]
-        # 상위 TOP_K
-        sorted_indices = filtered_indices[np.argsort(-all_sims[filtered_indices])]
-        top_indices = sorted_indices[:TOP_K]
-        return top_indices, all_sims
+        return self.search_embeddings(np.array([query_emb], dtype="float32"))[0]
+
+    def search_batch(self, queries, top_k=TOP_K):
+        """
+        여러 질문을 한 번의 encode 와 한 번의 Faiss search 로 검색한다.
+        질문마다 (threshold 이상인 상위 top_k 인덱스, 점수) 를 순서대로 반환한다.
+        """
+        if not queries:
+            return []
+        query_embs = self.embedding_model.encode(
+            list(queries),
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+        ).astype("float32")
+        return self.search_embeddings(query_embs, top_k)
+
+    def search_embeddings(self, query_embs, top_k=TOP_K):
+        query_embs = np.ascontiguousarray(query_embs, dtype="float32")
+        faiss.normalize_L2(query_embs)
+        # 상위 top_k 만 가져온 뒤 threshold 적용 (결과가 모자라면 id 가 -1)
+        scores, ids = self.index.search(query_embs, top_k)
+        keep = (ids >= 0) & (scores >= SIMILARITY_THRESHOLD)
+        return [(ids[row][keep[row]], scores[row][keep[row]]) for row in range(len(ids))]
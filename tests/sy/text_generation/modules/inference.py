@@ -49,16 +49,21 @@ class QAModel:
         )
 
     def generate_answer(self, prompt):
+        return self.generate_answers(prompt)[0]
+
+    def generate_answers(self, prompt, num_return_sequences=1):
         try:
             outputs = self.generator(
+                prompt,
                 temperature=0.2,
                 do_sample=True,
                 truncation=True,
                 repetition_penalty=1.0,
                 use_cache=True,
+                num_return_sequences=num_return_sequences,
+                return_full_text=False,
             )
-            raw_answer = outputs[0]["generated_text"]
+            raw_answers = [output["generated_text"] for output in outputs]
         except Exception:
-            raw_answer = FALLBACK_ANSWER
-        final_answer = moderate_output(raw_answer)
-        return final_answer
+            raw_answers = [FALLBACK_ANSWER] * num_return_sequences
+        return [moderate_output(raw_answer) for raw_answer in raw_answers]
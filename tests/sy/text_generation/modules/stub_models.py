@@ -0,0 +1,34 @@
+# modules/stub_models.py
+# 모델 다운로드/GPU 없이 서비스 전체 흐름을 확인하기 위한 작은 대체 모델
+
+import zlib
+import numpy as np
+
+
+class StubEmbeddingModel:
+    """문자 bigram 해시 벡터로 임베딩 (SentenceTransformer 와 같은 encode 인터페이스)"""
+
+    def __init__(self, dim=256):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        embeddings = np.zeros((len(texts), self.dim), dtype="float32")
+        for row, text in enumerate(texts):
+            for a, b in zip(text, text[1:]):
+                embeddings[row, zlib.crc32((a + b).encode("utf-8")) % self.dim] += 1.0
+        return embeddings
+
+
+class StubQAModel:
+    """프롬프트의 마지막 Instruction 을 그대로 돌려주는 생성 모델 (QAModel 과 같은 인터페이스)"""
+
+    def generate_answer(self, prompt):
+        return self.generate_answers(prompt)[0]
+
+    def generate_answers(self, prompt, num_return_sequences=1):
+        instructions = [line for line in prompt.splitlines() if line.startswith("Instruction:")]
+        last = instructions[-1][len("Instruction:"):].strip() if instructions else prompt.strip()
+        return [f"[stub] {last}"] * num_return_sequences
@@ -0,0 +1,228 @@
+# server.py
+# 임베딩 모델, Faiss 인덱스, 생성 모델을 시작할 때 한 번만 올려두고 HTTP 로 요청을 받는 상주 서비스
+# 사용 예: python server.py --port 8001
+#          python server.py --stub   (CPU 전용 테스트: 작은 대체 모델 사용)
+#
+# GET  /health/         프로세스 생존 확인
+# GET  /ready/          모델 로드와 warm-up 이 끝났으면 200, 로딩 중이면 503
+# POST /sllm/generate/  {"prompt", "num_return_sequences"} -> {"text"}  (agent.utils.sllm_client)
+# POST /rag/retrieve/   {"queries": [...], "top_k"} -> {"results": [...]}
+
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from modules.config import (
+    RAG_MAX_QUERIES,
+    RAG_MAX_RETURN_SEQUENCES,
+    RAG_MAX_TOP_K,
+    RAG_SERVER_HOST,
+    RAG_SERVER_PORT,
+    TOP_K,
+)
+from modules.data_loader import load_qa_dataset
+from modules.faiss_indexer import FaissIndexer
+from modules.preprocessor import (
+    sanitize_user_input,
+    prevent_prompt_injection,
+    extract_keywords,
+    sanitize_documents
+)
+
+logger = logging.getLogger("rag_server")
+
+
+class RAGService:
+    def __init__(self, stub=False):
+        self.stub = stub
+        self.ready = threading.Event()
+        self.error = None
+        self.qa_dataset = None
+        self.indexer = None
+        self.qa_model = None
+        # 생성 모델은 한 번에 한 요청만 처리
+        self._generate_lock = threading.Lock()
+
+    def load(self):
+        try:
+            started = time.perf_counter()
+            self.qa_dataset = load_qa_dataset()
+            if self.stub:
+                from modules.stub_models import StubEmbeddingModel, StubQAModel
+                self.indexer = FaissIndexer(self.qa_dataset, embedding_model=StubEmbeddingModel())
+                self.qa_model = StubQAModel()
+            else:
+                from modules.inference import QAModel
+                self.indexer = FaissIndexer(self.qa_dataset)
+                self.qa_model = QAModel()
+            loaded = self.indexer.load_or_build_index()
+            logger.info(f"index {'loaded from cache' if loaded else 'built'} ({len(self.qa_dataset)} docs)")
+
+            # 첫 요청이 느려지지 않도록 검색/생성을 한 번씩 미리 실행
+            self.retrieve(["복지 포인트 사용 방법"])
+            self.generate("Instruction: warm-up\nResponse:")
+            self.ready.set()
+            logger.info(f"ready in {time.perf_counter() - started:.1f}s")
+        except Exception as e:
+            self.error = e
+            logger.exception("failed to load RAG service")
+
+    def retrieve(self, queries, top_k=TOP_K):
+        # 인덱스 문서 수보다 많이 요청하면 faiss 가 -1 로 채우므로 문서 수로 제한
+        top_k = max(1, min(top_k, RAG_MAX_TOP_K, len(self.qa_dataset)))
+        # main.py 와 같은 전처리: 인젝션 방지 -> 개인정보 제거 -> 키워드 추출
+        search_queries = []
+        for query in queries:
+            processed = sanitize_user_input(prevent_prompt_injection(query))
+            keywords = extract_keywords(processed, top_n=4)
+            search_queries.append(" ".join(keywords) if keywords else processed)
+
+        results = []
+        for query, (top_indices, top_scores) in zip(queries, self.indexer.search_batch(search_queries, top_k)):
+            documents = sanitize_documents([self.qa_dataset[i] for i in top_indices])
+            results.append({
+                "query": query,
+                "matches": [
+                    {"index": int(i), "score": float(score), **document}
+                    for i, score, document in zip(top_indices, top_scores, documents)
+                ],
+            })
+        return results
+
+    def generate(self, prompt, num_return_sequences=1):
+        with self._generate_lock:
+            return self.qa_model.generate_answers(prompt, num_return_sequences)
+
+
+class RAGRequestHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def do_GET(self):
+        path = self._path()
+        if path == "/health/":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/ready/":
+            if self.service.ready.is_set():
+                self._send_json(200, {"status": "ready"})
+            elif self.service.error is not None:
+                self._send_json(500, {"status": "failed", "error": str(self.service.error)})
+            else:
+                self._send_json(503, {"status": "loading"})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        path = self._path()
+        if path not in ("/sllm/generate/", "/rag/retrieve/"):
+            self._send_json(404, {"error": "not found"})
+            return
+        if not self.service.ready.is_set():
+            self._send_json(503, {"error": "service is not ready"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length < 0:
+                raise ValueError("negative Content-Length")
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+        if not isinstance(body, dict):
+            self._send_json(400, {"error": "JSON body must be an object"})
+            return
+
+        try:
+            if path == "/sllm/generate/":
+                status, payload = self._generate(body)
+            else:
+                status, payload = self._retrieve(body)
+        except Exception:
+            logger.exception(f"failed to handle {path}")
+            status, payload = 500, {"error": "internal server error"}
+        self._send_json(status, payload)
+
+    def _generate(self, body):
+        prompt = body.get("prompt")
+        if not prompt or not isinstance(prompt, str):
+            return 400, {"error": "prompt is required"}
+        num_return_sequences = _int_param(body, "num_return_sequences", 1)
+        if num_return_sequences is None:
+            return 400, {"error": "num_return_sequences must be an integer"}
+        num_return_sequences = max(1, min(num_return_sequences, RAG_MAX_RETURN_SEQUENCES))
+        texts = self.service.generate(prompt, num_return_sequences)
+        return 200, {"text": texts[0] if num_return_sequences == 1 else texts}
+
+    def _retrieve(self, body):
+        queries = body.get("queries")
+        if queries is None:
+            queries = body.get("query")
+        # 문자열 하나는 질의 하나로 취급 (글자 단위로 나뉘지 않도록)
+        if isinstance(queries, str):
+            queries = [queries]
+        if not queries or not isinstance(queries, list):
+            return 400, {"error": "queries is required"}
+        if not all(isinstance(query, str) and query for query in queries):
+            return 400, {"error": "queries must be a list of non-empty strings"}
+        if len(queries) > RAG_MAX_QUERIES:
+            return 400, {"error": f"at most {RAG_MAX_QUERIES} queries per request"}
+        top_k = _int_param(body, "top_k", TOP_K)
+        if top_k is None:
+            return 400, {"error": "top_k must be an integer"}
+        return 200, {"results": self.service.retrieve(queries, top_k)}
+
+    def _path(self):
+        return urlparse(self.path).path.rstrip("/") + "/"
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.info(format % args)
+
+
+def _int_param(body, name, default):
+    """body[name] 을 정수로 읽는다. 없으면 default, 정수가 아니면 None"""
+    value = body.get(name, default)
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=RAG_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=RAG_SERVER_PORT)
+    parser.add_argument("--stub", action="store_true", help="작은 대체 모델로 실행 (CPU 전용 테스트)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    service = RAGService(stub=args.stub)
+    RAGRequestHandler.service = service
+    server = ThreadingHTTPServer((args.host, args.port), RAGRequestHandler)
+
+    # 모델 로드 중에도 /health/, /ready/ 에 응답하도록 로드는 별도 스레드에서 진행
+    threading.Thread(target=service.load, name="rag-loader", daemon=True).start()
+    logger.info(f"listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()